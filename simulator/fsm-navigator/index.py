@@ -6,6 +6,7 @@ Demonstrates traditional hierarchical navigation constraints
 
 from __future__ import annotations
 import json
+from array import array
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from mcp.server.fastmcp import FastMCP
@@ -13,18 +14,21 @@ from mcp.server.fastmcp import FastMCP
 # Load workflow datasets
 import os
 import sys
-import argparse
 
-# Parse command line arguments
-parser = argparse.ArgumentParser(description='FSM Workflow Navigator')
-parser.add_argument('dataset', nargs='?', 
-                   default='../workflow-dataset.json',
-                   help='Path to dataset JSON file (default: ../workflow-dataset.json)')
+# Parse the single optional positional by hand - building an argparse
+# parser is pure startup overhead for mcp-server.py, which imports this
+# module on every server start just to use the default dataset.
+_DEFAULT_DATASET = '../workflow-dataset.json'
+if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+    print(f"usage: {os.path.basename(sys.argv[0])} [dataset]\n\n"
+          f"dataset: Path to dataset JSON file (default: {_DEFAULT_DATASET})")
+    sys.exit(0)
 
-args = parser.parse_args()
+dataset_arg = sys.argv[1] if len(sys.argv) > 1 and not sys.argv[1].startswith('-') \
+    else _DEFAULT_DATASET
 
 # Load dataset from provided path
-dataset_path = Path(args.dataset)
+dataset_path = Path(dataset_arg)
 if not dataset_path.is_absolute():
     # If relative, resolve from navigator directory
     dataset_path = Path(__file__).parent.joinpath(dataset_path).resolve()
@@ -33,73 +37,266 @@ if not dataset_path.exists():
     print(f"Dataset file not found: {dataset_path}")
     sys.exit(1)
 
-WORKFLOW_DATA = json.loads(dataset_path.read_text())
+# Parse with pysimdjson's SIMD parser when available (no UTF-8 decode of
+# the whole file into a str). Entities are mutated in place by the tools,
+# so the document is materialized to plain dicts rather than kept as
+# lazy simdjson objects.
+try:
+    import simdjson
+    WORKFLOW_DATA = simdjson.Parser().parse(dataset_path.read_bytes()).as_dict()
+except ImportError:
+    WORKFLOW_DATA = json.loads(dataset_path.read_bytes())
 DATASET_NAME = dataset_path.stem  # Use filename without extension for display
 
+# States that count as "completion-like" for the manual FSM traversal.
+# The tuple keeps preference order for picking the next hop; the
+# frozenset serves O(1) membership tests.
+_COMPLETION_STATES = ('Done', 'Completed', 'Verified', 'Closed', 'Finished')
+_COMPLETION_STATE_SET = frozenset(_COMPLETION_STATES)
+
+def _precompute_completion_paths(entity) -> dict:
+    """Walk the greedy completion traversal once per possible start state"""
+    table = {}
+    transitions = entity.get('validTransitions', {})
+    states = set(transitions.keys())
+    for _targets in transitions.values():
+        states.update(_targets)
+
+    for start in states:
+        current = start
+        steps = 0
+        path = [start]
+        while steps < 10:  # Prevent infinite loops
+            possible_next = transitions.get(current, [])
+            if not possible_next:
+                break
+            possible_next_set = frozenset(possible_next)
+            current = next((s for s in _COMPLETION_STATES if s in possible_next_set),
+                           possible_next[0])
+            path.append(current)
+            steps += 1
+            if current in _COMPLETION_STATE_SET:
+                break
+        table[start] = (current, tuple(path), steps)
+    return table
+
+# Cache transition-key tuples per entity so hot tools don't rebuild
+# list(validTransitions.keys()) on every call just for error messages.
+# Completion paths are walked once here so completeItem becomes a lookup.
+for _entity in list(WORKFLOW_DATA['entities']['tasks'].values()) + \
+               list(WORKFLOW_DATA['entities']['bugs'].values()):
+    _entity['_validKeys'] = tuple(_entity['validTransitions'].keys())
+    _entity['_validKeysStr'] = ', '.join(_entity['_validKeys'])
+    _entity['_completionPaths'] = _precompute_completion_paths(_entity)
+    _entity['_assignedFragment'] = (f", assigned to {_entity['assignee']}"
+                                    if _entity.get('assignee') else "")
+
+# Detail responses only vary by state/assignee between calls, so the
+# static parts (name, id, transitions) are rendered once per entity and
+# only the two live fields are interpolated per call via format_map.
+_TASK_DETAIL_TMPL = ("Task: {name}\n"
+                     "ID: {id}\n"
+                     "State: {{state}}\n"
+                     "Assignee: {{assignee}}\n"
+                     "Valid Transitions: {vt}\n\n"
+                     "FSM: You are now at task {name}. You can updateTaskState or assignTask.")
+_BUG_DETAIL_TMPL = ("Bug: {name}\n"
+                    "ID: {id}\n"
+                    "State: {{state}}\n"
+                    "Assignee: {{assignee}}\n"
+                    "Priority: {priority}\n"
+                    "Valid States: {states}\n\n"
+                    "FSM: You are now at bug {name}. You can updateBugState or assignBug.")
+def _tmpl_escape(value) -> str:
+    """Escape braces so values baked in at template-build time survive
+    the per-call format_map pass untouched (entity names are data and
+    may contain anything - the chaos dataset exists to prove it)"""
+    return str(value).replace('{', '{{').replace('}', '}}')
+
+for _task in WORKFLOW_DATA['entities']['tasks'].values():
+    _task['_detailTmpl'] = _TASK_DETAIL_TMPL.format(
+        name=_tmpl_escape(_task['name']), id=_tmpl_escape(_task['id']),
+        vt=_tmpl_escape(_task['validTransitions']))
+for _bug in WORKFLOW_DATA['entities']['bugs'].values():
+    _bug['_detailTmpl'] = _BUG_DETAIL_TMPL.format(
+        name=_tmpl_escape(_bug['name']), id=_tmpl_escape(_bug['id']),
+        priority=_tmpl_escape(_bug.get('priority', 'None')),
+        states=_tmpl_escape(' → '.join(_bug['_validKeys'])))
+
+# Reverse index from child entity to owning project, so list caches can
+# be invalidated in O(1) when a task/bug mutates.
+TASK_PROJECT: Dict[str, str] = {}
+BUG_PROJECT: Dict[str, str] = {}
+for _pid, _project in WORKFLOW_DATA['entities']['projects'].items():
+    for _tid in _project['tasks']:
+        TASK_PROJECT[_tid] = _pid
+    for _bid in _project['bugs']:
+        BUG_PROJECT[_bid] = _pid
+    # Resolve child ids to entity references once; the list tools iterate
+    # these directly instead of re-hashing every child id per call.
+    # Filter through .get - the chaos dataset deliberately carries
+    # dangling child ids, which must not kill the server at startup.
+    _project['_taskRefs'] = [_t for _t in (WORKFLOW_DATA['entities']['tasks'].get(t)
+                                           for t in _project['tasks']) if _t is not None]
+    _project['_bugRefs'] = [_b for _b in (WORKFLOW_DATA['entities']['bugs'].get(b)
+                                          for b in _project['bugs']) if _b is not None]
+
+# Unified entity map - one hash probe instead of the chained
+# tasks.get(x) or bugs.get(x) fallback. Values are shared references,
+# so in-place mutations stay visible through either view.
+ENTITIES: Dict[str, dict] = {**WORKFLOW_DATA['entities']['tasks'],
+                             **WORKFLOW_DATA['entities']['bugs']}
+
+# Jump table keyed by the id prefix ('task'/'bug') for tools that
+# dispatch on identifier shape rather than known ids
+_KIND_TABLE = {'task': WORKFLOW_DATA['entities']['tasks'],
+               'bug': WORKFLOW_DATA['entities']['bugs']}
+
+# Entity kind lookup so dispatch paths do one hash probe instead of
+# repeated string-prefix scans.
+ENTITY_KIND: Dict[str, str] = {}
+for _tid in WORKFLOW_DATA['entities']['tasks']:
+    ENTITY_KIND[_tid] = 'task'
+for _bid in WORKFLOW_DATA['entities']['bugs']:
+    ENTITY_KIND[_bid] = 'bug'
+
+# Formatted list caches for listProjects/listTasks/listBugs. Only state
+# and assignee fields ever change, so entries are dropped when one of
+# those mutates and rebuilt lazily on next access.
+_PROJECT_LIST_CACHE: Optional[str] = None
+_TASK_LIST_CACHE: Dict[str, str] = {}
+_BUG_LIST_CACHE: Dict[str, str] = {}
+
+# Monotonic state version - bumped on every entity mutation so idempotent
+# read tools (checkGoals) can return their memoized rendering unchanged.
+_state_version = 0
+_last_check_version = -1
+_last_check_text = ''
+
+def _invalidate_task_list(task_id: str):
+    _TASK_LIST_CACHE.pop(TASK_PROJECT.get(task_id), None)
+
+def _invalidate_bug_list(bug_id: str):
+    _BUG_LIST_CACHE.pop(BUG_PROJECT.get(bug_id), None)
+
+# Inverted goal index: entity_id -> [(goal, entity, target_state)]. Built
+# once so goal checks after a mutation only look at goals attached to the
+# entity that actually changed instead of scanning the whole goals list.
+# GOAL_PREDICATES compiles each goal condition to a closure over the
+# resolved entity dict so checkGoals skips the per-call condition
+# indexing and tasks-or-bugs lookup chain entirely.
+GOALS_BY_ENTITY: Dict[str, List[tuple]] = {}
+GOAL_PREDICATES: List[tuple] = []
+# Goals are a list of dicts in the standard datasets but a dict keyed by
+# goal id in the chaos dataset (whose entries carry 'location' instead
+# of 'condition'); entries without an entity-style condition degrade to
+# "not indexable" rather than crashing the server at import.
+_goals = WORKFLOW_DATA.get('goals', [])
+for _goal in (_goals.values() if isinstance(_goals, dict) else _goals):
+    if not isinstance(_goal, dict):
+        continue
+    _condition = _goal.get('condition')
+    if not isinstance(_condition, dict) or 'entity' not in _condition:
+        continue
+    _goal_entity_id = _condition['entity']
+    _goal_state = _condition['state']
+    _goal_entity = ENTITIES.get(_goal_entity_id)
+    GOALS_BY_ENTITY.setdefault(_goal_entity_id, []).append(
+        (_goal, _goal_entity, _goal_state))
+    if _goal_entity is not None:
+        GOAL_PREDICATES.append(
+            (_goal, lambda e=_goal_entity, s=_goal_state: e['state'] == s))
+
+# listWorkflow only reads static structure (ids and names), so the full
+# response is rendered once here instead of walking the hierarchy per call.
+_listworkflow_items = []
+for _pid, _project in WORKFLOW_DATA['entities']['projects'].items():
+    _listworkflow_items.append(f"[PROJECT] {_pid}: {_project['name']}")
+    for _tid in _project.get('tasks', []):
+        _task = WORKFLOW_DATA['entities']['tasks'].get(_tid, {})
+        _listworkflow_items.append(f"  [TASK] {_tid}: {_task.get('name', 'Unknown')}")
+    for _bid in _project.get('bugs', []):
+        _bug = WORKFLOW_DATA['entities']['bugs'].get(_bid, {})
+        _listworkflow_items.append(f"  [BUG] {_bid}: {_bug.get('name', 'Unknown')}")
+_LISTWORKFLOW_CACHE = ("\n".join(_listworkflow_items) + "\n\n"
+                       "FSM: Items shown but not accessible without navigation")
+del _listworkflow_items
+
 print(f"FSM Navigator loaded with {DATASET_NAME} dataset", file=sys.stderr)
 
 # Create MCP server
 mcp = FastMCP("fsm-workflow-navigator")
 
+# Location kinds - hot guards compare these small ints instead of
+# running str.startswith against the location id
+LOC_ROOT, LOC_PROJECT, LOC_TASK, LOC_BUG = 0, 1, 2, 3
+
+# Tool-call counter lives in a preallocated array cell: incrementing via
+# subscript is cheaper bytecode than the LOAD_ATTR/STORE_ATTR pair on
+# the state object, and every tool pays this on entry.
+_tool_calls = array('Q', [0])
+
 # FSM State - single current location
 class FSMState:
+    __slots__ = ('location', 'location_kind', 'context', 'goals_found')
+
     def __init__(self):
         self.location = 'root'
+        self.location_kind = LOC_ROOT
         self.context = {}
-        self.tool_call_count = 0
-        self.goals_found = []
+        self.goals_found = set()
 
 # Global state instance
 fsm_state = FSMState()
 
-def check_goals_after_operation():
-    """Check if any goals were achieved"""
+def check_goals_after_operation(changed_entity_id=None):
+    """Check if any goals were achieved by the entity that just changed"""
     achieved_goals = []
-    
-    if 'goals' not in WORKFLOW_DATA:
-        return achieved_goals
-    
-    for goal in WORKFLOW_DATA['goals']:
+
+    for goal, entity, target_state in GOALS_BY_ENTITY.get(changed_entity_id, ()):
         if goal['id'] in fsm_state.goals_found:
             continue
-            
-        if 'entity' in goal['condition']:
-            entity_id = goal['condition']['entity']
-            target_state = goal['condition']['state']
-            
-            entity = WORKFLOW_DATA['entities']['tasks'].get(entity_id) or \
-                     WORKFLOW_DATA['entities']['bugs'].get(entity_id)
-            
-            if entity and entity['state'] == target_state:
-                fsm_state.goals_found.append(goal['id'])
-                achieved_goals.append(goal)
-    
+
+        if entity and entity['state'] == target_state:
+            fsm_state.goals_found.add(goal['id'])
+            achieved_goals.append(goal)
+
     return achieved_goals
 
+# Datasets without goals get a no-op check instead of paying the index
+# lookup on every state mutation
+if not GOALS_BY_ENTITY:
+    check_goals_after_operation = lambda changed_entity_id=None: ()
+
 # Define MCP tools
 @mcp.tool()
 def listProjects() -> str:
     """List all projects (FSM: always start here)"""
-    fsm_state.tool_call_count += 1
+    global _PROJECT_LIST_CACHE
+    _tool_calls[0] += 1
     fsm_state.location = 'projects'
-    
-    projects = list(WORKFLOW_DATA['entities']['projects'].values())
-    
-    project_list = '\n'.join([f"- {p['id']}: {p['name']} ({p['state']})" for p in projects])
-    
+    fsm_state.location_kind = LOC_PROJECT
+
+    projects = WORKFLOW_DATA['entities']['projects']
+
+    if _PROJECT_LIST_CACHE is None:
+        _PROJECT_LIST_CACHE = '\n'.join([f"- {p['id']}: {p['name']} ({p['state']})" for p in projects.values()])
+    project_list = _PROJECT_LIST_CACHE
+
     return (f"Projects ({len(projects)}):\n{project_list}\n\n"
             f"FSM: You are now at projects level. Use getProject to navigate to a specific project.")
 
 @mcp.tool()
 def getProject(projectId: str) -> str:
     """Get project details and navigate to it"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
     project = WORKFLOW_DATA['entities']['projects'].get(projectId)
     if not project:
         return "Project not found. Use listProjects first."
     
     fsm_state.location = projectId
+    fsm_state.location_kind = LOC_PROJECT
     fsm_state.context['currentProject'] = projectId
     
     return (f"Project: {project['name']}\n"
@@ -111,88 +308,85 @@ def getProject(projectId: str) -> str:
 @mcp.tool()
 def listTasks(projectId: str) -> str:
     """List tasks in current project"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
-    if fsm_state.location == 'root':
+    if fsm_state.location_kind == LOC_ROOT:
         return "FSM Error: Must navigate to project first. Use listProjects."
     
     project = WORKFLOW_DATA['entities']['projects'].get(projectId)
     if not project:
         return "Project not found."
     
-    tasks = [WORKFLOW_DATA['entities']['tasks'][tid] for tid in project['tasks']]
-    task_list = '\n'.join([
-        f"- {t['id']}: {t['name']} ({t['state']}{', assigned to ' + t['assignee'] if t.get('assignee') else ''})"
-        for t in tasks
-    ])
-    
+    task_list = _TASK_LIST_CACHE.get(projectId)
+    if task_list is None:
+        task_list = '\n'.join([
+            f"- {t['id']}: {t['name']} ({t['state']}{t['_assignedFragment']})"
+            for t in project['_taskRefs']
+        ])
+        _TASK_LIST_CACHE[projectId] = task_list
+
     return (f"Tasks in {project['name']}:\n{task_list}\n\n"
             f"FSM: Use getTask to navigate to a specific task.")
 
 @mcp.tool()
 def listBugs(projectId: str) -> str:
     """List bugs in current project"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
-    if fsm_state.location == 'root':
+    if fsm_state.location_kind == LOC_ROOT:
         return "FSM Error: Must navigate to project first. Use listProjects."
     
     project = WORKFLOW_DATA['entities']['projects'].get(projectId)
     if not project:
         return "Project not found."
     
-    bugs = [WORKFLOW_DATA['entities']['bugs'][bid] for bid in project['bugs']]
-    bug_list = '\n'.join([
-        f"- {b['id']}: {b['name']} ({b['state']}{', assigned to ' + b['assignee'] if b.get('assignee') else ''})"
-        for b in bugs
-    ])
-    
+    bug_list = _BUG_LIST_CACHE.get(projectId)
+    if bug_list is None:
+        bug_list = '\n'.join([
+            f"- {b['id']}: {b['name']} ({b['state']}{b['_assignedFragment']})"
+            for b in project['_bugRefs']
+        ])
+        _BUG_LIST_CACHE[projectId] = bug_list
+
     return (f"Bugs in {project['name']}:\n{bug_list}\n\n"
             f"FSM: Use getBug to navigate to a specific bug.")
 
 @mcp.tool()
 def getTask(taskId: str) -> str:
     """Get task details and navigate to it"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
     task = WORKFLOW_DATA['entities']['tasks'].get(taskId)
     if not task:
         return "Task not found. Use listTasks first."
     
     fsm_state.location = taskId
+    fsm_state.location_kind = LOC_TASK
     fsm_state.context['currentTask'] = taskId
-    
-    return (f"Task: {task['name']}\n"
-            f"ID: {task['id']}\n"
-            f"State: {task['state']}\n"
-            f"Assignee: {task.get('assignee', 'None')}\n"
-            f"Valid Transitions: {task['validTransitions']}\n\n"
-            f"FSM: You are now at task {task['name']}. You can updateTaskState or assignTask.")
+
+    return task['_detailTmpl'].format_map(
+        {'state': task['state'], 'assignee': task.get('assignee', 'None')})
 
 @mcp.tool()
 def getBug(bugId: str) -> str:
     """Get bug details and navigate to it"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
     bug = WORKFLOW_DATA['entities']['bugs'].get(bugId)
     if not bug:
         return "Bug not found. Use listBugs first."
     
     fsm_state.location = bugId
+    fsm_state.location_kind = LOC_BUG
     fsm_state.context['currentBug'] = bugId
-    
-    return (f"Bug: {bug['name']}\n"
-            f"ID: {bug['id']}\n"
-            f"State: {bug['state']}\n"
-            f"Assignee: {bug.get('assignee', 'None')}\n"
-            f"Priority: {bug['priority']}\n"
-            f"Valid States: {' → '.join(list(bug['validTransitions'].keys()))}\n\n"
-            f"FSM: You are now at bug {bug['name']}. You can updateBugState or assignBug.")
+
+    return bug['_detailTmpl'].format_map(
+        {'state': bug['state'], 'assignee': bug.get('assignee', 'None')})
 
 @mcp.tool()
 def getTaskState(taskId: str) -> str:
     """Check current state of a task"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
     task = WORKFLOW_DATA['entities']['tasks'].get(taskId)
     if not task:
@@ -203,9 +397,9 @@ def getTaskState(taskId: str) -> str:
 @mcp.tool()
 def updateTaskState(taskId: str, newState: str) -> str:
     """Update task state (must be at task location)"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
-    if not fsm_state.location.startswith('task-'):
+    if fsm_state.location_kind != LOC_TASK:
         return "FSM Error: Must be at task location. Use getTask first."
     
     task = WORKFLOW_DATA['entities']['tasks'].get(taskId)
@@ -213,11 +407,14 @@ def updateTaskState(taskId: str, newState: str) -> str:
         return "Task not found."
     
     # FSM requires checking valid transitions
-    if newState not in list(task['validTransitions'].keys()):
-        return f"Invalid state. Valid states: {', '.join(list(task['validTransitions'].keys()))}"
+    if newState not in task['validTransitions']:
+        return f"Invalid state. Valid states: {task['_validKeysStr']}"
     
+    global _state_version
     task['state'] = newState
-    achieved_goals = check_goals_after_operation()
+    _state_version += 1
+    _invalidate_task_list(taskId)
+    achieved_goals = check_goals_after_operation(taskId)
     
     goals_text = ""
     if achieved_goals:
@@ -229,20 +426,23 @@ def updateTaskState(taskId: str, newState: str) -> str:
 @mcp.tool()
 def updateBugState(bugId: str, newState: str) -> str:
     """Update bug state (must be at bug location)"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
-    if not fsm_state.location.startswith('bug-'):
+    if fsm_state.location_kind != LOC_BUG:
         return "FSM Error: Must be at bug location. Use getBug first."
     
     bug = WORKFLOW_DATA['entities']['bugs'].get(bugId)
     if not bug:
         return "Bug not found."
     
-    if newState not in list(bug['validTransitions'].keys()):
-        return f"Invalid state. Valid states: {', '.join(list(bug['validTransitions'].keys()))}"
+    if newState not in bug['validTransitions']:
+        return f"Invalid state. Valid states: {bug['_validKeysStr']}"
     
+    global _state_version
     bug['state'] = newState
-    achieved_goals = check_goals_after_operation()
+    _state_version += 1
+    _invalidate_bug_list(bugId)
+    achieved_goals = check_goals_after_operation(bugId)
     
     goals_text = ""
     if achieved_goals:
@@ -254,37 +454,42 @@ def updateBugState(bugId: str, newState: str) -> str:
 @mcp.tool()
 def assignTask(taskId: str, userId: str) -> str:
     """Assign task to user"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
     task = WORKFLOW_DATA['entities']['tasks'].get(taskId)
     if not task:
         return "Task not found. Use getTask first."
     
     task['assignee'] = userId
-    
+    task['_assignedFragment'] = f", assigned to {userId}"
+    _invalidate_task_list(taskId)
+
     return (f"Task {task['name']} assigned to {userId}.\n\n"
             f"FSM: Task assigned. Navigate elsewhere to continue.")
 
 @mcp.tool()
 def assignBug(bugId: str, userId: str) -> str:
     """Assign bug to user"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
     bug = WORKFLOW_DATA['entities']['bugs'].get(bugId)
     if not bug:
         return "Bug not found. Use getBug first."
     
     bug['assignee'] = userId
-    
+    bug['_assignedFragment'] = f", assigned to {userId}"
+    _invalidate_bug_list(bugId)
+
     return (f"Bug {bug['name']} assigned to {userId}.\n\n"
             f"FSM: Bug assigned. Navigate elsewhere to continue.")
 
 @mcp.tool()
 def navigateToRoot() -> str:
     """Return to root location"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
     fsm_state.location = 'root'
+    fsm_state.location_kind = LOC_ROOT
     fsm_state.context = {}
     
     return ("Returned to root.\n\n"
@@ -293,43 +498,46 @@ def navigateToRoot() -> str:
 @mcp.tool()
 def checkGoals() -> str:
     """Check which goals have been achieved"""
-    fsm_state.tool_call_count += 1
-    
+    global _last_check_version, _last_check_text
+    _tool_calls[0] += 1
+
     if 'goals' not in WORKFLOW_DATA:
         return "No goals defined in current dataset"
-    
+
+    # Nothing mutated since the last call - reuse the rendered response
+    if _state_version == _last_check_version:
+        return _last_check_text
+
     completed = []
     total_points = 0
-    
-    for goal in WORKFLOW_DATA['goals']:
-        if 'entity' in goal['condition']:
-            entity_id = goal['condition']['entity']
-            target_state = goal['condition']['state']
-            
-            entity = WORKFLOW_DATA['entities']['tasks'].get(entity_id) or \
-                     WORKFLOW_DATA['entities']['bugs'].get(entity_id)
-            
-            if entity and entity['state'] == target_state:
-                completed.append(f"✓ {goal['name']} ({goal['points']} points)")
-                total_points += goal['points']
-    
+
+    for goal, achieved in GOAL_PREDICATES:
+        if achieved():
+            completed.append(f"✓ {goal['name']} ({goal['points']} points)")
+            total_points += goal['points']
+
     completed_text = '\n'.join(completed) if completed else 'No goals completed yet'
-    
-    return (f"Goals Status:\n{completed_text}\n\n"
-            f"Total Points: {total_points}/800\n"
-            f"Goals Found by FSM: {len(fsm_state.goals_found)}")
+
+    _last_check_version = _state_version
+    _last_check_text = (f"Goals Status:\n{completed_text}\n\n"
+                        f"Total Points: {total_points}/800\n"
+                        f"Goals Found by FSM: {len(fsm_state.goals_found)}")
+    return _last_check_text
 
 @mcp.tool()
 def getMetrics() -> str:
     """Get FSM navigation metrics"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
     efficiency = "No goals yet"
     if fsm_state.goals_found:
-        efficiency = f"{fsm_state.tool_call_count / len(fsm_state.goals_found):.1f} calls per goal"
+        # Integer tenths instead of float division plus a format-spec parse
+        goals = len(fsm_state.goals_found)
+        tenths = (_tool_calls[0] * 10 + goals // 2) // goals
+        efficiency = f"{tenths // 10}.{tenths % 10} calls per goal"
     
     return (f"FSM Navigator Metrics:\n"
-            f"- Tool calls: {fsm_state.tool_call_count}\n"
+            f"- Tool calls: {_tool_calls[0]}\n"
             f"- Goals found: {len(fsm_state.goals_found)}\n"
             f"- Current location: {fsm_state.location}\n"
             f"- Efficiency: {efficiency}")
@@ -339,49 +547,33 @@ def getMetrics() -> str:
 @mcp.tool()
 def listWorkflow() -> str:
     """List all workflow items (FSM equivalent)"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
-    if fsm_state.location != 'root':
+    if fsm_state.location_kind != LOC_ROOT:
         return "FSM Error: Must be at root. Use navigateToRoot first."
-    
-    items = []
-    
-    # Must navigate through hierarchy to gather info
-    for project_id, project in WORKFLOW_DATA['entities']['projects'].items():
-        items.append(f"[PROJECT] {project_id}: {project['name']}")
-        
-        for task_id in project.get('tasks', []):
-            task = WORKFLOW_DATA['entities']['tasks'].get(task_id, {})
-            items.append(f"  [TASK] {task_id}: {task.get('name', 'Unknown')}")
-            
-        for bug_id in project.get('bugs', []):
-            bug = WORKFLOW_DATA['entities']['bugs'].get(bug_id, {})
-            items.append(f"  [BUG] {bug_id}: {bug.get('name', 'Unknown')}")
-    
-    return ("\n".join(items) + "\n\n"
-            "FSM: Items shown but not accessible without navigation")
+
+    # Hierarchy walk happened once at load - names never change
+    return _LISTWORKFLOW_CACHE
 
 @mcp.tool()
 def startWorkingOn(identifier: str) -> str:
     """Start working on task/bug (FSM must navigate first)"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
     # FSM cannot do direct access - must be at the entity location
-    if not fsm_state.location.startswith(identifier):
+    # (navigation stores the exact id, so equality replaces the prefix scan)
+    if fsm_state.location != identifier:
         return (f"FSM Error: Must navigate to {identifier} first.\n"
                 f"Current location: {fsm_state.location}\n"
                 f"Use getProject → getTask/getBug sequence.")
-    
-    # Determine entity type and get it
-    if identifier.startswith('task-'):
-        entity = WORKFLOW_DATA['entities']['tasks'].get(identifier)
-        entity_type = 'task'
-    elif identifier.startswith('bug-'):
-        entity = WORKFLOW_DATA['entities']['bugs'].get(identifier)
-        entity_type = 'bug'
-    else:
+
+    # Determine entity type via the prefix jump table
+    entity_type = identifier.partition('-')[0]
+    entities = _KIND_TABLE.get(entity_type)
+    if entities is None:
         return f"FSM Error: Unknown entity type for {identifier}"
-    
+
+    entity = entities.get(identifier)
     if not entity:
         return f"FSM Error: {identifier} not found"
     
@@ -395,9 +587,16 @@ def startWorkingOn(identifier: str) -> str:
         return f"FSM Error: No valid transitions from {current_state}"
     
     # Pick first available transition (FSM limitation - no semantic understanding)
+    global _state_version
     next_state = possible_next[0]
     entity['state'] = next_state
-    
+    _state_version += 1
+    if entity_type == 'task':
+        _invalidate_task_list(identifier)
+    else:
+        _invalidate_bug_list(identifier)
+    check_goals_after_operation(identifier)
+
     return (f"Started working on {entity['name']}\n"
             f"State: {current_state} → {next_state}\n"
             f"FSM: Mechanical state transition without semantic understanding")
@@ -405,51 +604,32 @@ def startWorkingOn(identifier: str) -> str:
 @mcp.tool()
 def completeItem(entityId: str) -> str:
     """Complete a task or bug (FSM must navigate manually)"""
-    fsm_state.tool_call_count += 1
+    _tool_calls[0] += 1
     
-    if not fsm_state.location.startswith(entityId):
+    if fsm_state.location != entityId:
         return f"FSM Error: Must navigate to {entityId} first"
     
     # FSM has to manually step through all states to completion
-    entity = (WORKFLOW_DATA['entities']['tasks'].get(entityId) or 
-              WORKFLOW_DATA['entities']['bugs'].get(entityId))
+    entity = ENTITIES.get(entityId)
     
     if not entity:
         return f"FSM Error: {entityId} not found"
     
     current_state = entity['state']
-    valid_transitions = entity.get('validTransitions', {})
-    
-    # FSM must manually traverse to find completion
-    steps = 0
-    path = [current_state]
-    
-    while steps < 10:  # Prevent infinite loops
-        possible_next = valid_transitions.get(current_state, [])
-        if not possible_next:
-            break
-            
-        # Look for a "completion-like" state
-        completion_states = ['Done', 'Completed', 'Verified', 'Closed', 'Finished']
-        next_state = None
-        
-        for state in completion_states:
-            if state in possible_next:
-                next_state = state
-                break
-        
-        if not next_state:
-            next_state = possible_next[0]  # Just pick first available
-        
-        current_state = next_state
-        path.append(current_state)
-        steps += 1
-        
-        if current_state in completion_states:
-            break
-    
+
+    # FSM traversal was walked once at load - completion is now a lookup
+    current_state, path, steps = entity['_completionPaths'].get(
+        current_state, (current_state, (current_state,), 0))
+
+    global _state_version
     entity['state'] = current_state
-    
+    _state_version += 1
+    if ENTITY_KIND.get(entityId) == 'task':
+        _invalidate_task_list(entityId)
+    else:
+        _invalidate_bug_list(entityId)
+    check_goals_after_operation(entityId)
+
     return (f"Completed {entity['name']} (attempted)\n"
             f"Path: {' → '.join(path)}\n"
             f"Steps: {steps}\n"
@@ -458,7 +638,7 @@ def completeItem(entityId: str) -> str:
 @mcp.tool()
 def updateState(entityId: str, newState: str) -> str:
     """Update entity state (FSM equivalent)"""
-    return updateTaskState(entityId, newState) if entityId.startswith('task-') else updateBugState(entityId, newState)
+    return updateTaskState(entityId, newState) if ENTITY_KIND.get(entityId) == 'task' else updateBugState(entityId, newState)
 
 @mcp.tool()
 def showMetrics() -> str:
@@ -6,6 +6,10 @@ Demonstrates formal Petri net modeling for workflow navigation
 
 from __future__ import annotations
 import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 from mcp.server.fastmcp import FastMCP
@@ -38,55 +42,362 @@ if not dataset_path.exists():
     print(f"Dataset file not found: {dataset_path}")
     sys.exit(1)
 
-WORKFLOW_DATA = json.loads(dataset_path.read_text())
+# orjson decodes bytes with a C parser several times faster than stdlib
+# json and skips the whole-file str decode; stdlib remains the fallback.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+import mmap
+import pickle
+
 DATASET_NAME = dataset_path.stem  # Use filename without extension for display
 
+
+def _parse_dataset():
+    """Parse the dataset straight out of the page cache via mmap"""
+    with open(dataset_path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            view = memoryview(mm)
+            try:
+                return _loads(view)
+            except TypeError:
+                # stdlib json cannot take a memoryview
+                return _loads(view.tobytes())
+            finally:
+                view.release()
+        finally:
+            mm.close()
+
+# Single translate pass + one regex substitution replace the old chain of
+# eleven str.replace calls and the O(n^2) '__' collapse loop. The cache
+# matters because the same "{id}_{state}" strings recur across net build,
+# token moves and hint generation.
+_SANITIZE_TABLE = str.maketrans({
+    ' ': '_', '-': '_', '!': '_EXCL', '(': '_LPAREN', ')': '_RPAREN',
+    "'": '_QUOTE', ',': '_COMMA', '.': '_DOT', ':': '_COLON',
+    '/': '_SLASH', '\\': '_BACKSLASH', '*': '_STAR'})
+_UNDERSCORES = re.compile(r'_{2,}')
+
+@lru_cache(maxsize=None)
+def _sanitize(name: str) -> str:
+    """Sanitize place names for SNAKES library compatibility.
+
+    Results are interned: place names key the marking, adjacency and
+    out-transition dicts, so equality checks collapse to pointer
+    comparisons and each name exists once on the heap."""
+    return sys.intern(_UNDERSCORES.sub('_', name.translate(_SANITIZE_TABLE)).strip('_'))
+
+
+@dataclass(slots=True)
+class EntityRecord:
+    """Precomputed per-entity lookup record shared by every tool"""
+    kind: str              # 'task' or 'bug'
+    entity: dict           # reference into WORKFLOW_DATA
+    valid_states: list     # workflow-ordered states
+    state_index: dict      # state -> position in valid_states
+    terminal_states: tuple # states with no outgoing transitions
+    final_state: str
+    reachable_from: dict   # state -> frozenset of forward-reachable states
+    valid_states_str: str  # pre-joined for display
+
+
+def _compute_closure(transitions, states) -> dict:
+    """Forward transitive closure over validTransitions via BFS per state"""
+    closure = {}
+    for start in states:
+        seen = set()
+        frontier = [start]
+        while frontier:
+            next_frontier = []
+            for state in frontier:
+                for target in transitions.get(state, ()):
+                    if target not in seen:
+                        seen.add(target)
+                        next_frontier.append(target)
+            frontier = next_frontier
+        closure[start] = frozenset(seen)
+    return closure
+
+
+def _bfs_path(transitions, src, dst):
+    """Shortest transition path from src to dst, or None if unreachable"""
+    parents = {src: None}
+    frontier = [src]
+    while frontier:
+        next_frontier = []
+        for state in frontier:
+            for target in transitions.get(state, ()):
+                if target not in parents:
+                    parents[target] = state
+                    if target == dst:
+                        path = [target]
+                        while parents[path[-1]] is not None:
+                            path.append(parents[path[-1]])
+                        path.reverse()
+                        return path
+                    next_frontier.append(target)
+        frontier = next_frontier
+    return None
+
+
+# Shortest paths are pure functions of the static transition graph, so
+# each reconstructed path is computed at most once per (entity, src, dst)
+_path_cache: dict = {}
+
+def _shortest_path(entity_id, transitions, src, dst):
+    key = (entity_id, src, dst)
+    path = _path_cache.get(key)
+    if path is None:
+        path = _bfs_path(transitions, src, dst)
+        _path_cache[key] = path
+    return path
+
+
+def _compute_valid_states(entity) -> list:
+    """Valid states in stable workflow order (keys first, then targets)"""
+    if 'validTransitions' not in entity:
+        return [entity['state']]
+    ordered = dict.fromkeys(entity['validTransitions'].keys())
+    for _targets in entity['validTransitions'].values():
+        ordered.update(dict.fromkeys(_targets))
+    return list(ordered)
+
+
+def _intern_strings(workflow_data):
+    """Intern entity ids and state names so the dict lookups that dominate
+    tool calls short-circuit on pointer identity"""
+    for name, collection in workflow_data['entities'].items():
+        workflow_data['entities'][name] = {
+            sys.intern(eid): entity for eid, entity in collection.items()}
+        for entity in collection.values():
+            if 'id' in entity:
+                entity['id'] = sys.intern(entity['id'])
+            if 'state' in entity:
+                entity['state'] = sys.intern(entity['state'])
+            transitions = entity.get('validTransitions')
+            if transitions:
+                entity['validTransitions'] = {
+                    sys.intern(state): [sys.intern(t) for t in targets]
+                    for state, targets in transitions.items()}
+
+
+def _build_entity_index(workflow_data) -> dict:
+    """Build the flat registry replacing per-tool chained lookups,
+    prefix dispatch, and repeated valid-state rebuilds"""
+    index: dict[str, EntityRecord] = {}
+    for kind, collection in (('task', workflow_data['entities']['tasks']),
+                             ('bug', workflow_data['entities']['bugs'])):
+        for eid, entity in collection.items():
+            states = _compute_valid_states(entity)
+            vt = entity.get('validTransitions', {})
+            # Terminal = declared with no outgoing transitions; fall back to
+            # conventional completion names when the workflow never closes
+            terminals = tuple(s for s in states if s in vt and not vt[s])
+            if not terminals:
+                terminals = tuple(s for s in ('Done', 'Complete', 'Finished', 'Closed')
+                                  if s in states)
+            index[eid] = EntityRecord(
+                kind=kind,
+                entity=entity,
+                valid_states=states,
+                state_index={s: i for i, s in enumerate(states)},
+                terminal_states=terminals,
+                final_state=terminals[-1] if terminals else states[-1],
+                reachable_from=_compute_closure(vt, states),
+                valid_states_str=', '.join(states))
+    return index
+
+
+# The parsed dataset and compiled registry are cached on disk keyed by
+# the dataset's mtime and size, so repeat launches skip the JSON parse,
+# sanitizer work and closure builds. Both structures go into one pickle
+# so the shared entity-dict references survive the round trip.
+_cache_path = dataset_path.with_suffix('.petri.pkl')
+_dataset_stat = dataset_path.stat()
+_CACHE_VERSION = 2  # bump when EntityRecord's layout changes
+
+_cached = None
+try:
+    if _cache_path.stat().st_mtime >= _dataset_stat.st_mtime:
+        with open(_cache_path, 'rb') as _f:
+            _cached = pickle.load(_f)
+        if _cached.get('source_size') != _dataset_stat.st_size or \
+                _cached.get('version') != _CACHE_VERSION:
+            _cached = None
+except Exception:
+    _cached = None
+
+if _cached is not None:
+    WORKFLOW_DATA = _cached['workflow']
+    ENTITY_INDEX: dict[str, EntityRecord] = _cached['index']
+else:
+    WORKFLOW_DATA = _parse_dataset()
+    _intern_strings(WORKFLOW_DATA)
+    ENTITY_INDEX = _build_entity_index(WORKFLOW_DATA)
+    try:
+        # Write-then-rename so concurrent server processes never read a
+        # truncated pickle
+        _tmp_path = _cache_path.with_suffix(f'.petri.pkl.{os.getpid()}.tmp')
+        with open(_tmp_path, 'wb') as _f:
+            pickle.dump({'version': _CACHE_VERSION,
+                         'source_size': _dataset_stat.st_size,
+                         'workflow': WORKFLOW_DATA,
+                         'index': ENTITY_INDEX},
+                        _f, pickle.HIGHEST_PROTOCOL)
+        os.replace(_tmp_path, _cache_path)
+    except Exception:
+        # Caching is best-effort (I/O and pickling failures alike)
+        try:
+            os.unlink(_tmp_path)
+        except OSError:
+            pass
+
+# Identifier resolution: exact id first, then exact/lowercased name,
+# then one substring scan over pre-lowered names - built once instead of
+# scanning and re-lowering every entity per lookup.
+_ENTITY_BY_NAME: dict[str, str] = {}
+_ENTITIES_LOWER: list[tuple[str, str]] = []
+for _eid, _rec in ENTITY_INDEX.items():
+    _name = _rec.entity.get('name')
+    if _name:
+        _ENTITY_BY_NAME.setdefault(_name, _eid)
+        _ENTITY_BY_NAME.setdefault(_name.lower(), _eid)
+        _ENTITIES_LOWER.append((_name.lower(), _eid))
+
+
+@lru_cache(maxsize=256)
+def _resolve_entity_id(identifier: str) -> Optional[str]:
+    """Resolve an entity id or (partial) name to a registry id"""
+    if identifier in ENTITY_INDEX:
+        return identifier
+    entity_id = _ENTITY_BY_NAME.get(identifier) or \
+        _ENTITY_BY_NAME.get(identifier.lower())
+    if entity_id:
+        return entity_id
+    ident_lower = identifier.lower()
+    for lower_name, candidate in _ENTITIES_LOWER:
+        if ident_lower in lower_name:
+            return candidate
+    return None
+
+
+# Goal conditions flattened to tuples once - checkGoals just unpacks and
+# compares against the state map. Goals are a list in the standard
+# datasets but a dict keyed by goal id in the chaos dataset (with
+# 'location' instead of 'condition'); entries without an entity-style
+# condition are skipped rather than crashing the server at import.
+_goals = WORKFLOW_DATA.get('goals', [])
+_GOAL_INDEX = [(g['id'], g['condition']['entity'], g['condition']['state'],
+                g['name'], g['points'])
+               for g in (_goals.values() if isinstance(_goals, dict) else _goals)
+               if isinstance(g, dict) and isinstance(g.get('condition'), dict)
+               and 'entity' in g['condition']]
+
 print(f"Petri Net Navigator loaded with {DATASET_NAME} dataset", file=sys.stderr)
 
 # Create MCP server
 mcp = FastMCP("Petri Net Navigator")
 
+# Static response templates hoisted out of the hot tool bodies; only the
+# live fields are interpolated per call.
+_MSG_START_WORK = ("Started working on {name}\n"
+                   "State: {cur} → {tgt}\n\n"
+                   "Next steps:\n{steps}"
+                   "\n\nPetri Net: Semantic operation bypassed navigation")
+_MSG_UPDATE_STATE = ("Updated {name}\n"
+                     "State: {cur} → {tgt}\n"
+                     "Petri Net: Direct state transition")
+_MSG_COMPLETE = ("Completed {name}\n"
+                 "State: {cur} → {tgt}\n"
+                 "Petri Net: Semantic completion bypassed intermediate states")
+_MSG_NAV_ROOT = ("Petri Net: No navigation required - all entities directly accessible\n"
+                 "Multi-entry architecture eliminates location constraints")
+
+def _bullets(lines) -> str:
+    """Render hint lines as a dashed list with a single join"""
+    return '- ' + '\n- '.join(lines) if lines else ''
+
+# Lite mode (default): markings live in the entity-state dict and the
+# formal SNAKES net is only built when a debug/visualize tool asks for
+# it. Set PETRI_LITE=0 to build the full net eagerly at startup.
+PETRI_LITE = os.environ.get('PETRI_LITE', '1') != '0'
+
 class WorkflowPetriNet:
     """Formal Petri net model of the workflow using SNAKES"""
-    
+
+    __slots__ = ('net', 'tokens', 'entity_state',
+                 'tool_calls', 'semantic_hints_used', 'goals_completed',
+                 '_token_gen', '_modes_cache', '_added_transitions',
+                 '_place_names', '_entity_transitions', '_out_transitions',
+                 '_trans_entity', '_trans_target', '_trans_arcs',
+                 '_next_state', '_hint_cache', '_valid_states_cache')
+
     def __init__(self):
-        self.net = PetriNet('workflow')
+        self.net = None   # SNAKES net, built lazily via _ensure_snakes()
         self.tokens = {}  # Track current token positions
-        self.metrics = {
-            'tool_calls': 0,
-            'semantic_hints_used': 0,
-            'goals_completed': []
-        }
-        self._build_net()
+        self.entity_state = {}  # entity_id -> current state (pre-split)
+        self._token_gen = 0       # bumped whenever the marking changes
+        self._modes_cache = None  # (token_gen, all modes, modes by entity)
+        self._added_transitions = set()  # names in the compiled adjacency
+        self._place_names = {}    # (entity_id, state) -> sanitized place name
+        self._entity_transitions = {}   # entity_id -> [transition names]
+        self._out_transitions = {}      # input place -> [transition names]
+        self._trans_entity = {}         # transition name -> entity_id
+        self._trans_target = {}         # transition name -> (place, state)
+        self._trans_arcs = {}           # transition name -> (in place, out place)
+        self._next_state = {}           # (entity_id, state) -> next state
+        self._hint_cache = {}           # (entity_id, state) -> hints dict
+        # Seed from the registry so both views agree on state ordering
+        self._valid_states_cache = {eid: rec.valid_states
+                                    for eid, rec in ENTITY_INDEX.items()}
+        # Metrics as plain slot attributes - the per-tool increment is a
+        # single attribute store instead of a dict get/set
+        self.tool_calls = 0
+        self.semantic_hints_used = 0
+        self.goals_completed = set()
+        # The compiled adjacency (plain dicts) is always built - it is
+        # what every runtime query uses. SNAKES structures are built on
+        # top of it only when actually demanded.
+        self._build_compiled()
+        for eid, rec in ENTITY_INDEX.items():
+            state = rec.entity['state']
+            self.entity_state[eid] = state
+            self.tokens[eid] = self._place_names[(eid, state)]
+        if not PETRI_LITE:
+            self._ensure_snakes()
+
+    def _ensure_snakes(self):
+        """Build the formal SNAKES net on first demand"""
+        if self.net is None:
+            self.net = PetriNet('workflow')
+            self._build_net()
     
     def _get_place_name(self, name: str) -> str:
         """Sanitize place names for SNAKES library compatibility"""
-        # Replace spaces with underscores and special characters with descriptive text
-        sanitized = name.replace(' ', '_')
-        sanitized = sanitized.replace('!', '_EXCL')
-        sanitized = sanitized.replace('(', '_LPAREN').replace(')', '_RPAREN')
-        sanitized = sanitized.replace("'", '_QUOTE')
-        sanitized = sanitized.replace(',', '_COMMA')
-        sanitized = sanitized.replace('.', '_DOT')
-        sanitized = sanitized.replace('-', '_')
-        sanitized = sanitized.replace(':', '_COLON')
-        sanitized = sanitized.replace('/', '_SLASH')
-        sanitized = sanitized.replace('\\', '_BACKSLASH')
-        sanitized = sanitized.replace('*', '_STAR')
-        # Remove multiple consecutive underscores
-        while '__' in sanitized:
-            sanitized = sanitized.replace('__', '_')
-        return sanitized.strip('_')
+        return _sanitize(name)
     
     def _get_valid_states(self, entity):
-        """Extract valid states list from validTransitions"""
+        """Extract valid states list from validTransitions (memoized per entity)"""
+        entity_id = entity.get('id')
+        cached = self._valid_states_cache.get(entity_id)
+        if cached is not None:
+            return cached
+
         if 'validTransitions' in entity:
             valid_states = set(entity['validTransitions'].keys())
             for transitions in entity['validTransitions'].values():
                 valid_states.update(transitions)
-            return list(valid_states)
+            result = list(valid_states)
         else:
-            return [entity['state']]  # fallback
+            result = [entity['state']]  # fallback
+
+        if entity_id is not None:
+            self._valid_states_cache[entity_id] = result
+        return result
     
     def _build_net(self):
         """Build the Petri net structure from workflow data"""
@@ -102,10 +413,12 @@ class WorkflowPetriNet:
                 place_name = self._get_place_name(f"{task_id}_{state}")
                 self.net.add_place(Place(place_name, []))
             
-            # Add initial token
-            initial_place = self._get_place_name(f"{task_id}_{task['state']}")
+            # Add initial token (honoring moves made before a lazy build)
+            current = self.entity_state.get(task_id, task['state'])
+            initial_place = self._get_place_name(f"{task_id}_{current}")
             self.net.place(initial_place).add(task_id)
             self.tokens[task_id] = initial_place
+            self.entity_state[task_id] = current
         
         # Create places for bug states
         for bug_id, bug in WORKFLOW_DATA['entities']['bugs'].items():
@@ -119,103 +432,132 @@ class WorkflowPetriNet:
                 place_name = self._get_place_name(f"{bug_id}_{state}")
                 self.net.add_place(Place(place_name, []))
             
-            initial_place = self._get_place_name(f"{bug_id}_{bug['state']}")
+            current = self.entity_state.get(bug_id, bug['state'])
+            initial_place = self._get_place_name(f"{bug_id}_{current}")
             self.net.place(initial_place).add(bug_id)
             self.tokens[bug_id] = initial_place
+            self.entity_state[bug_id] = current
         
-        # Create transitions for state changes
-        self._add_task_transitions()
-        self._add_bug_transitions()
-        self._add_semantic_transitions()
-    
-    def _add_task_transitions(self):
-        """Add transitions for task state changes"""
-        for task_id, task in WORKFLOW_DATA['entities']['tasks'].items():
-            transitions = task['validTransitions']
-            
-            # Create transitions based on valid transition mappings
-            for from_state, to_states in transitions.items():
-                for to_state in to_states:
-                    trans_name = self._get_place_name(f"{task_id}_{from_state}_to_{to_state}")
-                    
-                    self.net.add_transition(Transition(trans_name))
-                    self.net.add_input(self._get_place_name(f"{task_id}_{from_state}"), trans_name, Variable('token'))
-                    self.net.add_output(self._get_place_name(f"{task_id}_{to_state}"), trans_name, Variable('token'))
-                
-            # Add backward transitions where appropriate
-            task_states = self._get_valid_states(task)
-            if "In Progress" in task_states and "Open" in task_states:
-                trans_name = self._get_place_name(f"{task_id}_reopen")
-                self.net.add_transition(Transition(trans_name))
-                self.net.add_input(self._get_place_name(f"{task_id}_In Progress"), trans_name, Variable('token'))
-                self.net.add_output(self._get_place_name(f"{task_id}_Open"), trans_name, Variable('token'))
-    
-    def _add_bug_transitions(self):
-        """Add transitions for bug state changes"""
-        for bug_id, bug in WORKFLOW_DATA['entities']['bugs'].items():
-            transitions = bug['validTransitions']
-            
-            # Create transitions based on valid transition mappings
+        # Register the precompiled transitions with SNAKES
+        for trans_name, (input_place, output_place) in self._trans_arcs.items():
+            self.net.add_transition(Transition(trans_name))
+            self.net.add_input(input_place, trans_name, Variable('token'))
+            self.net.add_output(output_place, trans_name, Variable('token'))
+
+    def _compile_transition(self, entity_id, trans_name, input_place,
+                            output_place, target_state):
+        """Record a transition in the compiled adjacency (idempotent)"""
+        if trans_name in self._added_transitions:
+            return
+        self._added_transitions.add(trans_name)
+        self._trans_arcs[trans_name] = (input_place, output_place)
+        self._entity_transitions.setdefault(entity_id, []).append(trans_name)
+        self._out_transitions.setdefault(input_place, []).append(trans_name)
+        self._trans_entity[trans_name] = entity_id
+        self._trans_target[trans_name] = (output_place, target_state)
+
+    def _build_compiled(self):
+        """Compile places and transitions (direct + semantic) into plain
+        dicts from the registry - no SNAKES structures involved"""
+        for entity_id, rec in ENTITY_INDEX.items():
+            entity = rec.entity
+            transitions = entity.get('validTransitions', {})
+            valid_states = rec.valid_states
+
+            # One sanitizer call per state instead of one per transition;
+            # remembered so move_token can reuse the strings later
+            place_by_state = {s: _sanitize(f"{entity_id}_{s}")
+                              for s in {*valid_states, entity['state']}}
+            for _state, _name in place_by_state.items():
+                self._place_names[(entity_id, _state)] = _name
+
+            # "What comes next?" resolved once per consecutive state pair
+            for _s1, _s2 in zip(valid_states, valid_states[1:]):
+                self._next_state[(entity_id, _s1)] = _s2
+
+            # Direct transitions from the valid transition mappings
             for from_state, to_states in transitions.items():
                 for to_state in to_states:
-                    trans_name = self._get_place_name(f"{bug_id}_{from_state}_to_{to_state}")
-                    
-                    self.net.add_transition(Transition(trans_name))
-                    self.net.add_input(self._get_place_name(f"{bug_id}_{from_state}"), trans_name, Variable('token'))
-                    self.net.add_output(self._get_place_name(f"{bug_id}_{to_state}"), trans_name, Variable('token'))
-    
-    def _add_semantic_transitions(self):
-        """Add high-level semantic transitions that cross multiple states"""
-        # Start working on task (Open -> next state with assignment)
-        for task_id, task in WORKFLOW_DATA['entities']['tasks'].items():
-            if "Open" in self._get_valid_states(task) and len(self._get_valid_states(task)) > 1:
-                # Find the next state after Open
-                open_idx = self._get_valid_states(task).index("Open")
-                if open_idx < len(self._get_valid_states(task)) - 1:
-                    next_state = self._get_valid_states(task)[open_idx + 1]
-                    trans_name = self._get_place_name(f"start_work_{task_id}")
-                    self.net.add_transition(Transition(trans_name))
-                    self.net.add_input(self._get_place_name(f"{task_id}_Open"), trans_name, Variable('token'))
-                    self.net.add_output(self._get_place_name(f"{task_id}_{next_state}"), trans_name, Variable('token'))
-        
-        # Complete task (any state -> terminal states)
-        for task_id, task in WORKFLOW_DATA['entities']['tasks'].items():
-            valid_states = self._get_valid_states(task)
-            # Find terminal states (states with no outgoing transitions)
-            terminal_states = []
-            for state in valid_states:
-                if state in task['validTransitions'] and not task['validTransitions'][state]:
-                    terminal_states.append(state)
-            
-            # If no terminal states found, try common completion states
-            if not terminal_states:
-                for completion_state in ['Done', 'Complete', 'Finished', 'Closed']:
-                    if completion_state in valid_states:
-                        terminal_states.append(completion_state)
-            
-            # Create completion transitions to terminal states
-            for terminal_state in terminal_states:
+                    self._compile_transition(
+                        entity_id,
+                        _sanitize(f"{entity_id}_{from_state}_to_{to_state}"),
+                        place_by_state[from_state], place_by_state[to_state],
+                        to_state)
+
+            if rec.kind != 'task':
+                continue
+
+            # Backward transition where appropriate
+            if "In Progress" in place_by_state and "Open" in place_by_state:
+                self._compile_transition(entity_id,
+                                         _sanitize(f"{entity_id}_reopen"),
+                                         place_by_state["In Progress"],
+                                         place_by_state["Open"], "Open")
+
+            # Semantic: start working (Open -> next state)
+            open_idx = rec.state_index.get("Open")
+            if open_idx is not None and open_idx < len(valid_states) - 1:
+                self._compile_transition(entity_id,
+                                         _sanitize(f"start_work_{entity_id}"),
+                                         place_by_state["Open"],
+                                         place_by_state[valid_states[open_idx + 1]],
+                                         valid_states[open_idx + 1])
+
+            # Semantic: complete (any state -> terminal states)
+            for terminal_state in rec.terminal_states:
                 for state in valid_states:
                     if state != terminal_state:
-                        trans_name = self._get_place_name(f"complete_{task_id}_from_{state}")
-                        self.net.add_transition(Transition(trans_name))
-                        self.net.add_input(self._get_place_name(f"{task_id}_{state}"), trans_name, Variable('token'))
-                        self.net.add_output(self._get_place_name(f"{task_id}_{terminal_state}"), trans_name, Variable('token'))
+                        self._compile_transition(
+                            entity_id,
+                            _sanitize(f"complete_{entity_id}_from_{state}"),
+                            place_by_state[state], place_by_state[terminal_state],
+                            terminal_state)
     
     def get_enabled_transitions(self, entity_id: Optional[str] = None) -> list[str]:
-        """Get all currently enabled transitions"""
-        try:
-            modes = list(self.net.modes())
-            if entity_id:
-                # Filter to transitions affecting this entity
-                return [str(m) for m in modes if entity_id in str(m)]
-            return [str(m) for m in modes]
-        except:
-            # Fallback for complex bindings
-            return []
-    
+        """Get all currently enabled transitions (cached per marking)"""
+        if entity_id:
+            # 1-safe state-machine net: enabled transitions for an entity
+            # are exactly the ones leaving the place its token occupies
+            place = self.tokens.get(entity_id)
+            return self._out_transitions.get(place, []) if place else []
+
+        cache = self._modes_cache
+        if cache is None or cache[0] != self._token_gen:
+            # Union of each token's outgoing transitions - no SNAKES
+            # marking walk and no substring filtering
+            all_modes = []
+            for eid, place in self.tokens.items():
+                all_modes.extend(self._out_transitions.get(place, ()))
+            cache = (self._token_gen, all_modes)
+            self._modes_cache = cache
+        return cache[1]
+    
+    def _relocate_token(self, transition_name):
+        """Move the bookkeeping for a fired transition's token - O(1) via
+        the target map recorded at build time, no place scanning"""
+        entity_id = self._trans_entity.get(transition_name)
+        if entity_id is not None:
+            target_place, target_state = self._trans_target[transition_name]
+            self.tokens[entity_id] = target_place
+            self.entity_state[entity_id] = target_state
+        self._token_gen += 1
+        self._modes_cache = None
+
     def fire_transition(self, transition_name: str, binding: Optional[dict] = None) -> bool:
         """Fire a transition with optional variable binding"""
+        if binding is None and self.net is None:
+            # Compiled fast path: enabled iff the entity's token sits on
+            # the transition's input place
+            entity_id = self._trans_entity.get(transition_name)
+            if entity_id is None:
+                return False
+            input_place, _ = self._trans_arcs[transition_name]
+            if self.tokens.get(entity_id) != input_place:
+                return False
+            self._relocate_token(transition_name)
+            return True
+
+        self._ensure_snakes()
         try:
             if binding:
                 sub = Substitution(**binding)
@@ -225,7 +567,11 @@ class WorkflowPetriNet:
                 for mode in self.net.modes():
                     if str(mode).startswith(transition_name):
                         mode.fire()
+                        self._relocate_token(transition_name)
                         return True
+                # No enabled mode matched - nothing fired
+                return False
+            self._relocate_token(transition_name)
             return True
         except Exception as e:
             print(f"Failed to fire transition: {e}")
@@ -233,74 +579,91 @@ class WorkflowPetriNet:
     
     def move_token(self, entity_id: str, target_state: str) -> bool:
         """Move a token to a new state (simulating transition firing)"""
-        current_place = self.tokens.get(entity_id)
-        if not current_place:
+        rec = ENTITY_INDEX.get(entity_id)
+        if rec is None or target_state not in rec.state_index:
             return False
-            
-        target_place = f"{entity_id}_{target_state}"
-        
-        # Check if target place exists
-        try:
-            self.net.place(target_place)
-        except:
+
+        # Semantic legality first - no SNAKES involvement for a move the
+        # transition graph cannot reach
+        current = self.entity_state.get(entity_id)
+        if current is not None and target_state != current and \
+                target_state not in rec.reachable_from.get(current, frozenset()):
             return False
-        
-        # Move token
-        try:
-            # Remove from current place
-            self.net.place(current_place).remove(entity_id)
-            # Add to target place
-            self.net.place(target_place).add(entity_id)
-            self.tokens[entity_id] = target_place
-            return True
-        except:
+
+        # Membership test against the names compiled at startup - no
+        # exception-driven probe, and properly sanitized (the old raw
+        # f-string never matched places for states containing spaces)
+        target_place = self._place_names.get((entity_id, target_state))
+        if target_place is None:
             return False
+
+        if self.net is not None:
+            # Keep the formal marking in sync when the net exists
+            try:
+                self.net.place(self.tokens[entity_id]).remove(entity_id)
+                self.net.place(target_place).add(entity_id)
+            except:
+                return False
+
+        self.tokens[entity_id] = target_place
+        self.entity_state[entity_id] = target_state
+        self._token_gen += 1
+        self._modes_cache = None
+        return True
     
     def generate_semantic_hints(self, entity_id: str) -> dict[str, list[str]]:
         """Generate context-aware hints based on Petri net state"""
-        current_state = self.tokens.get(entity_id, "Unknown")
-        if '_' in current_state:
-            current_state = current_state.split('_', 1)[1]
-        
-        hints = {
-            'nextSteps': [],
-            'suggestions': []
-        }
-        
+        current_state = self.entity_state.get(entity_id, "Unknown")
+
+        # Hints are a pure function of (entity, state): the enabled set
+        # depends only on the token's place, so entries never go stale
+        cache_key = (entity_id, current_state)
+        cached = self._hint_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        next_steps = []
+        suggestions = []
+
         # Get enabled transitions for this entity
         enabled = self.get_enabled_transitions(entity_id)
-        
-        # Task-specific hints
+
+        # Task-specific hints (lists assigned as sized literals - no
+        # append-growth in the hot path)
         if entity_id.startswith('task-'):
-            task = WORKFLOW_DATA['entities']['tasks'].get(entity_id, {})
-            
             if current_state == "Open":
-                hints['nextSteps'].append("You can start working on this task")
-                hints['suggestions'].append(f"Use startWorkingOn('{entity_id}') to begin")
-            elif current_state in ["In Progress", "Ready", "Deploying"]:
-                hints['nextSteps'].append("Task is actively being worked on")
-                hints['suggestions'].append(f"Complete with completeItem('{entity_id}')")
+                next_steps = ["You can start working on this task"]
+                suggestions = [f"Use startWorkingOn('{entity_id}') to begin"]
+            elif current_state in ("In Progress", "Ready", "Deploying"):
+                next_steps = ["Task is actively being worked on"]
+                suggestions = [f"Complete with completeItem('{entity_id}')"]
             elif current_state == "Review":
-                hints['nextSteps'].append("Task needs review")
-                hints['suggestions'].append("Move to Testing or back to In Progress")
-                
-        # Bug-specific hints        
+                next_steps = ["Task needs review"]
+                suggestions = ["Move to Testing or back to In Progress"]
+
+        # Bug-specific hints
         elif entity_id.startswith('bug-'):
             if current_state == "Open":
-                hints['nextSteps'].append("Bug needs investigation")
-                hints['suggestions'].append(f"Start with startWorkingOn('{entity_id}')")
+                next_steps = ["Bug needs investigation"]
+                suggestions = [f"Start with startWorkingOn('{entity_id}')"]
             elif current_state == "Investigating":
-                hints['nextSteps'].append("Bug is being investigated")
-                hints['suggestions'].append("Move to Fixing once cause is found")
-                
+                next_steps = ["Bug is being investigated"]
+                suggestions = ["Move to Fixing once cause is found"]
+
         # Multi-entity hints
         if len(enabled) > 1:
-            hints['suggestions'].append("Multiple workflow paths available")
-            
+            suggestions.append("Multiple workflow paths available")
+
+        hints = {
+            'nextSteps': next_steps,
+            'suggestions': suggestions
+        }
+        self._hint_cache[cache_key] = hints
         return hints
     
     def visualize(self) -> Optional[str]:
         """Generate a visual representation of the current Petri net state"""
+        self._ensure_snakes()
         if hasattr(self.net, 'draw'):
             try:
                 # This would generate a GraphViz representation
@@ -309,45 +672,57 @@ class WorkflowPetriNet:
                 pass
         return None
 
+# Version-keyed response cache for pure-read tools: an entry stays
+# valid until the marking generation changes.
+_RESPONSE_CACHE: dict = {}
+
+def _versioned_cache(fn):
+    """Serve a read tool's rendered response from cache until a token
+    move invalidates it; the tool-call counter still advances."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        # FastMCP invokes tools with keyword arguments, so they are part
+        # of the cache key (sorted for a stable ordering)
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        hit = _RESPONSE_CACHE.get(key)
+        if hit is not None and hit[0] == petri_net._token_gen:
+            petri_net.tool_calls += 1
+            return hit[1]
+        result = fn(*args, **kwargs)
+        _RESPONSE_CACHE[key] = (petri_net._token_gen, result)
+        return result
+    return wrapper
+
 # Global instance
 petri_net = WorkflowPetriNet()
 
 # MCP Tools
 @mcp.tool()
+@_versioned_cache
 def listWorkflow() -> str:
     """List all workflow items"""
-    petri_net.metrics['tool_calls'] += 1
-    
-    items = []
-    
-    # List tasks
-    for task_id, task in WORKFLOW_DATA['entities']['tasks'].items():
-        current_state = get_entity_state(task_id)
-        items.append(f"[TASK] {task_id}: {task['name']} - State: {current_state}")
-    
-    # List bugs  
-    for bug_id, bug in WORKFLOW_DATA['entities']['bugs'].items():
-        current_state = get_entity_state(bug_id)
-        items.append(f"[BUG] {bug_id}: {bug['name']} - State: {current_state}")
+    petri_net.tool_calls += 1
     
+    # Single registry pass (tasks first, then bugs, by insertion order)
+    entity_state = petri_net.entity_state
+    items = [f"[{rec.kind.upper()}] {entity_id}: {rec.entity['name']} - "
+             f"State: {entity_state.get(entity_id, 'Unknown')}"
+             for entity_id, rec in ENTITY_INDEX.items()]
+
     return "\n".join(items) + "\n\nPetri Net: All items accessible without navigation"
 
 def get_entity_state(entity_id: str) -> str:
-    """Get current state from token position"""
-    place = petri_net.tokens.get(entity_id, "")
-    if '_' in place:
-        return place.split('_', 1)[1]
-    return "Unknown"
+    """Get current state from the maintained state map"""
+    return petri_net.entity_state.get(entity_id, "Unknown")
 
 @mcp.tool()
+@_versioned_cache
 def showCurrentTokens() -> str:
     """Show current token positions in Petri net"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
-    positions = []
-    for entity_id, place in petri_net.tokens.items():
-        state = place.split('_', 1)[1] if '_' in place else place
-        positions.append(f"{entity_id}: {state}")
+    positions = [f"{entity_id}: {state}"
+                 for entity_id, state in petri_net.entity_state.items()]
     
     enabled_count = len(petri_net.get_enabled_transitions())
     
@@ -358,186 +733,200 @@ def showCurrentTokens() -> str:
 @mcp.tool() 
 def getTaskInfo(taskId: str) -> str:
     """Get task information with semantic hints"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
-    task = WORKFLOW_DATA['entities']['tasks'].get(taskId)
-    if not task:
+    rec = ENTITY_INDEX.get(taskId)
+    if rec is None or rec.kind != 'task':
         return f"Task {taskId} not found"
-    
+
+    task = rec.entity
     current_state = get_entity_state(taskId)
     hints = petri_net.generate_semantic_hints(taskId)
-    
+
     # Track if hints are being used
     if hints['suggestions']:
-        petri_net.metrics['semantic_hints_used'] += 1
-    
-    result = (f"Task: {task['name']}\n"
-              f"ID: {taskId}\n" 
-              f"Current State: {current_state}\n"
-              f"Valid States: {', '.join(petri_net._get_valid_states(task))}\n")
-    
+        petri_net.semantic_hints_used += 1
+
+    parts = [f"Task: {task['name']}",
+             f"ID: {taskId}",
+             f"Current State: {current_state}",
+             f"Valid States: {rec.valid_states_str}"]
+
     if hints['nextSteps']:
-        result += f"\nNext Steps:\n" + "\n".join(f"- {h}" for h in hints['nextSteps'])
-    
+        parts.append("\nNext Steps:\n" + _bullets(hints['nextSteps']))
+
     if hints['suggestions']:
-        result += f"\n\nSuggestions:\n" + "\n".join(f"- {h}" for h in hints['suggestions'])
-    
-    return result + "\n\nPetri Net: Multi-entry access with contextual guidance"
+        parts.append("\nSuggestions:\n" + _bullets(hints['suggestions']))
+
+    parts.append("\nPetri Net: Multi-entry access with contextual guidance")
+    return "\n".join(parts)
 
 @mcp.tool()
 def getBugInfo(bugId: str) -> str:
     """Get bug information with semantic hints"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
-    bug = WORKFLOW_DATA['entities']['bugs'].get(bugId)
-    if not bug:
+    rec = ENTITY_INDEX.get(bugId)
+    if rec is None or rec.kind != 'bug':
         return f"Bug {bugId} not found"
-    
+
+    bug = rec.entity
     current_state = get_entity_state(bugId)
     hints = petri_net.generate_semantic_hints(bugId)
-    
+
     if hints['suggestions']:
-        petri_net.metrics['semantic_hints_used'] += 1
-    
-    result = (f"Bug: {bug['name']}\n"
-              f"ID: {bugId}\n"
-              f"Current State: {current_state}\n"
-              f"Severity: {bug.get('severity', 'Medium')}\n"
-              f"Valid States: {', '.join(self._get_valid_states(bug))}\n")
-    
+        petri_net.semantic_hints_used += 1
+
+    parts = [f"Bug: {bug['name']}",
+             f"ID: {bugId}",
+             f"Current State: {current_state}",
+             f"Severity: {bug.get('severity', 'Medium')}",
+             f"Valid States: {rec.valid_states_str}"]
+
     if hints['nextSteps']:
-        result += f"\nNext Steps:\n" + "\n".join(f"- {h}" for h in hints['nextSteps'])
-    
+        parts.append("\nNext Steps:\n" + _bullets(hints['nextSteps']))
+
     if hints['suggestions']:
-        result += f"\n\nSuggestions:\n" + "\n".join(f"- {h}" for h in hints['suggestions'])
-    
-    return result + "\n\nPetri Net: Direct access with workflow guidance"
+        parts.append("\nSuggestions:\n" + _bullets(hints['suggestions']))
+
+    parts.append("\nPetri Net: Direct access with workflow guidance")
+    return "\n".join(parts)
 
 @mcp.tool()
 def startWorkingOn(identifier: str) -> str:
     """Start working on a task or bug (multi-entry semantic operation)"""
-    petri_net.metrics['tool_calls'] += 1
-    
-    # Determine entity type
-    if identifier.startswith('task-'):
-        entity_type = 'task'
-        entities = WORKFLOW_DATA['entities']['tasks']
-    elif identifier.startswith('bug-'):
-        entity_type = 'bug'
-        entities = WORKFLOW_DATA['entities']['bugs']
-    else:
-        return f"Unknown identifier format: {identifier}"
-    
-    entity = entities.get(identifier)
-    if not entity:
-        return f"{entity_type.title()} {identifier} not found"
+    petri_net.tool_calls += 1
     
+    entity_id = _resolve_entity_id(identifier)
+    rec = ENTITY_INDEX.get(entity_id) if entity_id else None
+    if rec is None:
+        return f"Unknown identifier format: {identifier}"
+
+    identifier = entity_id
+    entity = rec.entity
+    entity_type = rec.kind
+
     current_state = get_entity_state(identifier)
-    
+
     # Semantic operation - move from Open to working state
     if current_state == "Open":
         # Find appropriate working state
         if entity_type == 'task':
-            valid_states = petri_net._get_valid_states(entity)
-            open_idx = valid_states.index("Open")
-            if open_idx < len(valid_states) - 1:
-                target_state = valid_states[open_idx + 1]
-            else:
-                target_state = "In Progress"  # fallback
+            target_state = petri_net._next_state.get(
+                (identifier, "Open"), "In Progress")
         else:  # bug
             target_state = "Investigating"
         
         if petri_net.move_token(identifier, target_state):
             hints = petri_net.generate_semantic_hints(identifier)
-            petri_net.metrics['semantic_hints_used'] += 1
-            
-            return (f"Started working on {entity['name']}\n"
-                    f"State: {current_state} → {target_state}\n\n"
-                    f"Next steps:\n" + 
-                    "\n".join(f"- {h}" for h in hints['nextSteps']) +
-                    "\n\nPetri Net: Semantic operation bypassed navigation")
+            petri_net.semantic_hints_used += 1
+
+            return _MSG_START_WORK.format_map(
+                {'name': entity['name'], 'cur': current_state,
+                 'tgt': target_state, 'steps': _bullets(hints['nextSteps'])})
     else:
         return f"Cannot start work - {entity['name']} is in {current_state} state"
 
 @mcp.tool()
 def updateState(entityId: str, newState: str) -> str:
     """Update entity state if transition is valid"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
     # Check if entity exists
-    entity = (WORKFLOW_DATA['entities']['tasks'].get(entityId) or 
-              WORKFLOW_DATA['entities']['bugs'].get(entityId))
-    
-    if not entity:
+    rec = ENTITY_INDEX.get(entityId)
+    if rec is None:
         return f"Entity {entityId} not found"
-    
+
+    entity = rec.entity
     current_state = get_entity_state(entityId)
-    
+
     # Check if new state is valid
-    if newState not in petri_net._get_valid_states(entity):
-        return f"Invalid state '{newState}'. Valid states: {', '.join(petri_net._get_valid_states(entity))}"
+    if newState not in rec.state_index:
+        return f"Invalid state '{newState}'. Valid states: {', '.join(rec.valid_states)}"
     
     # Try to move token
     if petri_net.move_token(entityId, newState):
-        return (f"Updated {entity['name']}\n"
-                f"State: {current_state} → {newState}\n"
-                f"Petri Net: Direct state transition")
+        return _MSG_UPDATE_STATE.format_map(
+            {'name': entity['name'], 'cur': current_state, 'tgt': newState})
     else:
         return f"Cannot transition from {current_state} to {newState}"
 
+@mcp.tool()
+def updateStateMulti(entityId: str, states: list[str]) -> str:
+    """Advance an entity through several states in a single call"""
+    petri_net.tool_calls += 1
+
+    rec = ENTITY_INDEX.get(entityId)
+    if rec is None:
+        return f"Entity {entityId} not found"
+    if not states:
+        return "No states requested"
+
+    transitions = rec.entity.get('validTransitions', {})
+    current_state = get_entity_state(entityId)
+
+    # Validate the whole path against the adjacency before mutating
+    previous = current_state
+    for state in states:
+        if state not in transitions.get(previous, ()):
+            return (f"Invalid path for {rec.entity['name']}: "
+                    f"no transition {previous} → {state}")
+        previous = state
+
+    # Commit as a single marking assignment
+    if not petri_net.move_token(entityId, states[-1]):
+        return f"Cannot transition {rec.entity['name']} to {states[-1]}"
+
+    return (f"Advanced {rec.entity['name']}\n"
+            f"Path: {' → '.join([current_state, *states])}\n"
+            f"Petri Net: {len(states)} transitions committed in one call")
+
 @mcp.tool()
 def completeItem(entityId: str) -> str:
     """Complete a task or bug (semantic operation)"""
-    petri_net.metrics['tool_calls'] += 1
-    
-    entity = (WORKFLOW_DATA['entities']['tasks'].get(entityId) or 
-              WORKFLOW_DATA['entities']['bugs'].get(entityId))
+    petri_net.tool_calls += 1
     
-    if not entity:
+    resolved = _resolve_entity_id(entityId)
+    rec = ENTITY_INDEX.get(resolved) if resolved else None
+    if rec is None:
         return f"Entity {entityId} not found"
-    
+
+    entityId = resolved
+    entity = rec.entity
     current_state = get_entity_state(entityId)
-    valid_states = self._get_valid_states(entity)
-    final_state = valid_states[-1]  # Last state is completion
+    final_state = rec.final_state
     
     if current_state == final_state:
         return f"{entity['name']} is already in {final_state} state"
     
     # Semantic transition - jump to done
     if petri_net.move_token(entityId, final_state):
-        petri_net.metrics['goals_completed'].append(entityId)
-        return (f"Completed {entity['name']}\n"
-                f"State: {current_state} → {final_state}\n"
-                f"Petri Net: Semantic completion bypassed intermediate states")
+        petri_net.goals_completed.add(entityId)
+        return _MSG_COMPLETE.format_map(
+            {'name': entity['name'], 'cur': current_state, 'tgt': final_state})
     else:
         return f"Cannot complete {entity['name']} from {current_state} state"
 
 @mcp.tool()
 def reassignItem(entityId: str, fromUser: str, toUser: str) -> str:
     """Reassign a task or bug between users"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
-    entity = (WORKFLOW_DATA['entities']['tasks'].get(entityId) or 
-              WORKFLOW_DATA['entities']['bugs'].get(entityId))
-    
-    if not entity:
+    rec = ENTITY_INDEX.get(entityId)
+    if rec is None:
         return f"Entity {entityId} not found"
-    
+
+    entity = rec.entity
     current_state = get_entity_state(entityId)
-    
-    # Get assignment-related states based on entity type
-    if entityId.startswith('task-'):
-        states = petri_net._get_valid_states(WORKFLOW_DATA['entities']['tasks'][entityId])
-    else:
-        states = petri_net._get_valid_states(WORKFLOW_DATA['entities']['bugs'][entityId])
-    
+    states = rec.valid_states
+
     # Check if in assignable state (not Open or Done typically)
     if current_state in ["Open", states[-1]]:  # First or last state
         goals_text = ""
     else:
         # Generate goal context
         incomplete_goals = [g for g in ['task-ui', 'task-api', 'task-auth', 'task-deploy'] 
-                           if g not in petri_net.metrics['goals_completed']]
+                           if g not in petri_net.goals_completed]
         if incomplete_goals:
             goals_text = f"\n\nRemaining goals: {', '.join(incomplete_goals)}"
         else:
@@ -551,33 +940,32 @@ def reassignItem(entityId: str, fromUser: str, toUser: str) -> str:
 @mcp.tool()
 def advanceWorkflow(identifiers: list[str]) -> str:
     """Advance multiple items concurrently"""
-    petri_net.metrics['tool_calls'] += 1
-    
-    results = []
-    for identifier in identifiers:
-        entity = (WORKFLOW_DATA['entities']['tasks'].get(identifier) or 
-                  WORKFLOW_DATA['entities']['bugs'].get(identifier))
-        
-        if not entity:
-            results.append(f"{identifier}: Not found")
+    petri_net.tool_calls += 1
+    
+    # Preallocated results and hoisted lookups - one registry probe and
+    # one state read per identifier
+    results = [None] * len(identifiers)
+    entity_state = petri_net.entity_state
+    for i, identifier in enumerate(identifiers):
+        rec = ENTITY_INDEX.get(identifier)
+
+        if rec is None:
+            results[i] = f"{identifier}: Not found"
             continue
-            
-        current_state = get_entity_state(identifier)
-        valid_states = petri_net._get_valid_states(entity)
-        
-        # Find next state
-        try:
-            current_idx = valid_states.index(current_state)
-            if current_idx < len(valid_states) - 1:
-                next_state = valid_states[current_idx + 1]
-                if petri_net.move_token(identifier, next_state):
-                    results.append(f"{identifier}: {current_state} → {next_state}")
-                else:
-                    results.append(f"{identifier}: Transition failed")
+
+        current_state = entity_state.get(identifier, "Unknown")
+
+        # Find next state via the precomputed consecutive-state map
+        next_state = petri_net._next_state.get((identifier, current_state))
+        if current_state not in rec.state_index:
+            results[i] = f"{identifier}: Unknown current state"
+        elif next_state is None:
+            results[i] = f"{identifier}: Already at final state"
+        else:
+            if petri_net.move_token(identifier, next_state):
+                results[i] = f"{identifier}: {current_state} → {next_state}"
             else:
-                results.append(f"{identifier}: Already at final state")
-        except ValueError:
-            results.append(f"{identifier}: Unknown current state")
+                results[i] = f"{identifier}: Transition failed"
     
     return ("Concurrent advancement results:\n" + 
             "\n".join(results) + 
@@ -587,10 +975,10 @@ def advanceWorkflow(identifiers: list[str]) -> str:
 def showMetrics() -> str:
     """Show navigation efficiency metrics"""
     return (f"Petri Net Navigator Metrics:\n"
-            f"- Total tool calls: {petri_net.metrics['tool_calls']}\n"
-            f"- Semantic hints used: {petri_net.metrics['semantic_hints_used']}\n"
-            f"- Goals completed: {len(petri_net.metrics['goals_completed'])}\n"
-            f"- Completed items: {', '.join(petri_net.metrics['goals_completed']) or 'None'}\n\n"
+            f"- Total tool calls: {petri_net.tool_calls}\n"
+            f"- Semantic hints used: {petri_net.semantic_hints_used}\n"
+            f"- Goals completed: {len(petri_net.goals_completed)}\n"
+            f"- Completed items: {', '.join(sorted(petri_net.goals_completed)) or 'None'}\n\n"
             f"Key advantages demonstrated:\n"
             f"- Multi-entry operations (no navigation required)\n"
             f"- Semantic transitions (skip intermediate states)\n"
@@ -600,43 +988,38 @@ def showMetrics() -> str:
 @mcp.tool()
 def analyzeReachability(entityId: str, targetState: str) -> str:
     """Analyze if a target state is reachable from current position"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
-    entity = (WORKFLOW_DATA['entities']['tasks'].get(entityId) or 
-              WORKFLOW_DATA['entities']['bugs'].get(entityId))
-    
-    if not entity:
+    rec = ENTITY_INDEX.get(entityId)
+    if rec is None:
         return f"Entity {entityId} not found"
-    
+
     current_state = get_entity_state(entityId)
-    valid_states = petri_net._get_valid_states(entity)
-    
-    if targetState not in valid_states:
+
+    if targetState not in rec.state_index:
         return f"'{targetState}' is not a valid state for {entityId}"
     
     if current_state == targetState:
         return f"{entityId} is already in {targetState} state"
     
-    # Check reachability
-    current_idx = valid_states.index(current_state) if current_state in valid_states else -1
-    target_idx = valid_states.index(targetState)
-    
-    if current_idx < target_idx:
-        steps = target_idx - current_idx
-        path = " → ".join(valid_states[current_idx:target_idx+1])
+    # Check reachability against the precomputed forward closure
+    if targetState in rec.reachable_from.get(current_state, frozenset()):
+        path = _shortest_path(entityId, rec.entity.get('validTransitions', {}),
+                              current_state, targetState)
         return (f"Target state '{targetState}' is reachable\n"
-                f"Steps required: {steps}\n"
-                f"Path: {path}\n"
+                f"Steps required: {len(path) - 1}\n"
+                f"Path: {' → '.join(path)}\n"
                 f"Petri Net: Formal reachability analysis")
     else:
         return (f"Target state '{targetState}' is not reachable from {current_state}\n"
-                f"Would require backward transition")
+                f"No forward transition path exists")
 
 @mcp.tool()
 def debugPetriNet() -> str:
     """Show detailed Petri net structure for debugging"""
-    petri_net.metrics['tool_calls'] += 1
-    
+    petri_net.tool_calls += 1
+    petri_net._ensure_snakes()
+
     info = ["=== Petri Net Debug Info ===\n"]
     
     # Show places and tokens
@@ -647,9 +1030,8 @@ def debugPetriNet() -> str:
     # Show enabled transitions
     info.append("\nEnabled transitions:")
     enabled = petri_net.get_enabled_transitions()
-    for trans in enabled[:10]:  # Limit output
-        info.append(f"  {trans}")
-    
+    info.extend(f"  {trans}" for trans in islice(enabled, 10))  # Limit output
+
     if len(enabled) > 10:
         info.append(f"  ... and {len(enabled) - 10} more")
     
@@ -668,7 +1050,7 @@ def debugPetriNet() -> str:
 @mcp.tool()
 def listProjects() -> str:
     """List projects (compatibility tool)"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
     projects = []
     for project_id, project in WORKFLOW_DATA['entities']['projects'].items():
@@ -680,7 +1062,7 @@ def listProjects() -> str:
 @mcp.tool()
 def getProject(projectId: str) -> str:
     """Get project details (compatibility tool)"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
     project = WORKFLOW_DATA['entities']['projects'].get(projectId)
     if not project:
@@ -698,7 +1080,7 @@ def getProject(projectId: str) -> str:
 @mcp.tool()
 def listTasks(projectId: str) -> str:
     """List tasks in project (compatibility tool)"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
     project = WORKFLOW_DATA['entities']['projects'].get(projectId)
     if not project:
@@ -716,7 +1098,7 @@ def listTasks(projectId: str) -> str:
 @mcp.tool()
 def listBugs(projectId: str) -> str:
     """List bugs in project (compatibility tool)"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
     project = WORKFLOW_DATA['entities']['projects'].get(projectId)
     if not project:
@@ -742,9 +1124,10 @@ def getBug(bugId: str) -> str:
     return getBugInfo(bugId)
 
 @mcp.tool()
+@_versioned_cache
 def getTaskState(taskId: str) -> str:
     """Get current task state"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
     current_state = get_entity_state(taskId)
     return f"Task {taskId} state: {current_state}"
@@ -759,64 +1142,55 @@ def updateBugState(bugId: str, newState: str) -> str:
     """Update bug state (alias for updateState)"""
     return updateState(bugId, newState)
 
+def _assign_entity(kind: str, entity_id: str, user_id: str) -> str:
+    """Shared core for the assign tools - one registry probe"""
+    petri_net.tool_calls += 1
+
+    rec = ENTITY_INDEX.get(entity_id)
+    if rec is None or rec.kind != kind:
+        return f"{kind.title()} {entity_id} not found"
+
+    rec.entity['assignee'] = user_id
+
+    return (f"Assigned {rec.entity['name']} to {user_id}\n"
+            f"Petri Net: Direct assignment without navigation overhead")
+
 @mcp.tool()
 def assignTask(taskId: str, userId: str) -> str:
     """Assign task to user"""
-    petri_net.metrics['tool_calls'] += 1
-    
-    task = WORKFLOW_DATA['entities']['tasks'].get(taskId)
-    if not task:
-        return f"Task {taskId} not found"
-    
-    task['assignee'] = userId
-    
-    return (f"Assigned {task['name']} to {userId}\n"
-            f"Petri Net: Direct assignment without navigation overhead")
+    return _assign_entity('task', taskId, userId)
 
 @mcp.tool()
 def assignBug(bugId: str, userId: str) -> str:
     """Assign bug to user"""
-    petri_net.metrics['tool_calls'] += 1
-    
-    bug = WORKFLOW_DATA['entities']['bugs'].get(bugId)
-    if not bug:
-        return f"Bug {bugId} not found"
-    
-    bug['assignee'] = userId
-    
-    return (f"Assigned {bug['name']} to {userId}\n"
-            f"Petri Net: Direct assignment without navigation overhead")
+    return _assign_entity('bug', bugId, userId)
 
 @mcp.tool()
 def navigateToRoot() -> str:
     """Navigate to root (no-op for Petri net)"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
-    return ("Petri Net: No navigation required - all entities directly accessible\n"
-            "Multi-entry architecture eliminates location constraints")
+    return _MSG_NAV_ROOT
 
 @mcp.tool()
+@_versioned_cache
 def checkGoals() -> str:
     """Check goal completion status"""
-    petri_net.metrics['tool_calls'] += 1
+    petri_net.tool_calls += 1
     
     if 'goals' not in WORKFLOW_DATA:
         return "No goals defined in current dataset"
     
     completed = []
     total_points = 0
-    
-    for goal in WORKFLOW_DATA['goals']:
-        if 'entity' in goal['condition']:
-            entity_id = goal['condition']['entity']
-            target_state = goal['condition']['state']
-            current_state = get_entity_state(entity_id)
-            
-            if current_state == target_state:
-                completed.append(f"✓ {goal['name']} ({goal['points']} points)")
-                total_points += goal['points']
-                if entity_id not in petri_net.metrics['goals_completed']:
-                    petri_net.metrics['goals_completed'].append(entity_id)
+    entity_state = petri_net.entity_state
+    goals_completed = petri_net.goals_completed
+
+    for goal_id, entity_id, target_state, goal_name, points in _GOAL_INDEX:
+        if entity_state.get(entity_id) == target_state:
+            completed.append(f"✓ {goal_name} ({points} points)")
+            total_points += points
+            goals_completed.add(entity_id)
     
     completed_text = '\n'.join(completed) if completed else 'No goals completed yet'
     
@@ -824,6 +1198,48 @@ def checkGoals() -> str:
             f"Total Points: {total_points}\n"
             f"Petri Net: Goal verification through token analysis")
 
+def _startup_smoke_test():
+    """Call every tool once with known ids so wiring errors surface at
+    startup instead of on the first user call (completeItem and
+    getBugInfo used to die with NameError the first time they ran).
+    Mutates state, so it only runs in PETRI_SMOKE_TEST mode."""
+    task_id = next((e for e, r in ENTITY_INDEX.items() if r.kind == 'task'), None)
+    bug_id = next((e for e, r in ENTITY_INDEX.items() if r.kind == 'bug'), None)
+    project_id = next(iter(WORKFLOW_DATA['entities']['projects']), None)
+
+    calls = [
+        (listWorkflow, ()), (showCurrentTokens, ()), (listProjects, ()),
+        (getProject, (project_id,)), (listTasks, (project_id,)),
+        (listBugs, (project_id,)), (getTaskInfo, (task_id,)),
+        (getBugInfo, (bug_id,)), (getTaskState, (task_id,)),
+        (startWorkingOn, (task_id,)),
+        (updateState, (task_id, ENTITY_INDEX[task_id].valid_states[0])),
+        (updateStateMulti, (task_id, [])),
+        (completeItem, (task_id,)),
+        (reassignItem, (task_id, 'user-a', 'user-b')),
+        (advanceWorkflow, ([bug_id],)),
+        (assignTask, (task_id, 'user-a')), (assignBug, (bug_id, 'user-a')),
+        (analyzeReachability, (task_id, ENTITY_INDEX[task_id].final_state)),
+        (navigateToRoot, ()), (checkGoals, ()), (showMetrics, ()),
+        (debugPetriNet, ()),
+    ]
+
+    failures = []
+    for tool, tool_args in calls:
+        try:
+            tool(*tool_args)
+        except Exception as e:
+            failures.append(f"{tool.__name__}: {type(e).__name__}: {e}")
+
+    if failures:
+        print("Smoke test failures:\n" + "\n".join(failures), file=sys.stderr)
+        sys.exit(1)
+    print(f"Smoke test passed: {len(calls)} tools callable", file=sys.stderr)
+
+
 # Run the server
 if __name__ == "__main__":
+    if os.environ.get('PETRI_SMOKE_TEST') == '1':
+        _startup_smoke_test()
+        sys.exit(0)
     mcp.run()
\ No newline at end of file
@@ -6,759 +6,786 @@ This script connects to both MCP servers and compares their performance
 on identical workflow goals, measuring actual tool calls and efficiency.
 """
 
+import atexit
+import importlib.util
 import json
+import mmap
+import os
+import re
 import asyncio
 import subprocess
+import sys
+import itertools
 import time
 import random
 from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional
+from collections import namedtuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 
 # Will be loaded dynamically based on dataset file path
 WORKFLOW_DATA = None
 
-@dataclass
+# 'stdio' spawns the navigator subprocesses and talks JSON-RPC (the
+# faithful MCP measurement); 'in-process' imports the navigator modules
+# and calls their tool functions directly, skipping the RPC layer when
+# only tool-call counts matter. Set via --transport or HARNESS_INPROC=1.
+TRANSPORT = 'in-process' if os.environ.get('HARNESS_INPROC') == '1' else 'stdio'
+
+# One scripted tool invocation inside a goal's call table
+Call = namedtuple("Call", "tool args completes_goal")
+
+# orjson serializes the streamed result records a few times faster than
+# stdlib json; fall back transparently when it is not installed.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+    _dumpb = orjson.dumps
+
+    def _dump_summary(obj, path):
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
+    _loads = json.loads
+
+    def _dumpb(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _dump_summary(obj, path):
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+# The envelope never changes between tool calls - only id and params do,
+# so the outer JSON is a bytes template substituted per send.
+_CALL_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":"tools/call","params":%s}\n'
+
+def _encode_call(msg_id: int, tool_name: str, arguments: dict) -> bytes:
+    return _CALL_TEMPLATE % (
+        msg_id, _dumpb({"name": tool_name, "arguments": arguments}))
+
+# The handshake frames are identical for every client (a fresh client's
+# first request id is always 1), so they are encoded once at import.
+_INIT_FRAME = _dumpb({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "test-harness", "version": "1.0.0"}
+    }
+}) + b"\n"
+_INITIALIZED_FRAME = _dumpb({
+    "jsonrpc": "2.0",
+    "method": "notifications/initialized",
+    "params": {}
+}) + b"\n"
+
+
+@lru_cache(maxsize=None)
+def load_dataset(path_str: str):
+    """Parse a dataset once per path - the decoder reads a page-cache
+    backed mmap view instead of a heap copy made by read()"""
+    with open(path_str, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            view = memoryview(mapped)
+            try:
+                return _loads(view)
+            except TypeError:
+                # stdlib json cannot take a memoryview
+                return _loads(view.tobytes())
+            finally:
+                view.release()
+        finally:
+            mapped.close()
+
+# Single compiled scan of the response - no lowercased copy per call
+_HINT_RE = re.compile(r"hints|suggestion", re.IGNORECASE)
+
+@dataclass(slots=True)
 class NavigationMetrics:
     """Metrics for a single navigation approach"""
     name: str
     tool_calls: int = 0
+    cached_calls: int = 0
     goals_completed: List[str] = field(default_factory=list)
-    paths_taken: List[List[str]] = field(default_factory=list)
+    # Columnar call log: one (goal index, tool name) row per call; the
+    # nested per-goal path lists are reconstructed only at serialization
+    call_log: List[Tuple[int, str]] = field(default_factory=list)
+    goal_count: int = 0
+    current_goal_calls: int = 0
     semantic_hints_followed: int = 0
     time_elapsed: float = 0.0
     errors_encountered: int = 0
     
-    def add_tool_call(self, tool_name: str, result: str = ""):
-        self.tool_calls += 1
-        if self.paths_taken:
-            self.paths_taken[-1].append(tool_name)
+    def add_tool_call(self, tool_name: str, result: str = "", cached: bool = False):
+        # Cache replays still show up in the path but are counted
+        # separately so the round-trip metric stays honest
+        if cached:
+            self.cached_calls += 1
+        else:
+            self.tool_calls += 1
+        if self.goal_count:
+            self.call_log.append((self.goal_count - 1, tool_name))
+            self.current_goal_calls += 1
         # Count semantic hints usage
-        if "hints" in result.lower() or "suggestion" in result.lower():
+        if _HINT_RE.search(result):
             self.semantic_hints_followed += 1
     
     def start_new_goal(self):
-        self.paths_taken.append([])
+        self.goal_count += 1
+        self.current_goal_calls = 0
+
+    def merge(self, other: "NavigationMetrics"):
+        """Fold a concurrent worker's counters into this aggregate"""
+        offset = self.goal_count
+        self.tool_calls += other.tool_calls
+        self.cached_calls += other.cached_calls
+        self.goals_completed.extend(other.goals_completed)
+        self.call_log.extend((g + offset, t) for g, t in other.call_log)
+        self.goal_count += other.goal_count
+        self.semantic_hints_followed += other.semantic_hints_followed
+        self.time_elapsed += other.time_elapsed
+        self.errors_encountered += other.errors_encountered
+
+    def paths_as_lists(self) -> List[List[str]]:
+        """Rebuild the nested per-goal paths for the JSON output shape"""
+        paths = [[] for _ in range(self.goal_count)]
+        for goal_idx, tool_name in self.call_log:
+            paths[goal_idx].append(tool_name)
+        return paths
     
     def complete_goal(self, goal_id: str):
         self.goals_completed.append(goal_id)
     
     def get_average_calls_per_goal(self) -> float:
-        if len(self.goals_completed) == 0:
+        if not self.goals_completed:
             return 0
         return self.tool_calls / len(self.goals_completed)
 
+# Resolved once at import - subprocess launches and in-process loads
+# just index into these instead of rebuilding paths per client.
+_BASE = Path(__file__).resolve().parent
+_NAVIGATOR_DIRS = {'fsm': _BASE / 'fsm-navigator',
+                   'petri': _BASE / 'petri-navigator'}
+
+class MCPTimeout(Exception):
+    """A tool call's response did not arrive within the timeout"""
+
+class MCPServerDied(Exception):
+    """The MCP server closed its stdout with requests in flight"""
+
 class MCPClient:
     """Simple MCP client to communicate with servers"""
-    
+
+    # Pure reads whose responses can be replayed between mutations
+    READ_ONLY_TOOLS = frozenset({"listProjects", "getProject", "listTasks",
+                                 "listBugs", "getTask", "getBug",
+                                 "getTaskInfo", "getBugInfo", "getTaskState"})
+
     def __init__(self, navigator_type: str, dataset_path: str):
         self.navigator_type = navigator_type
         self.dataset_path = dataset_path
         self.process = None
         self.request_id = 0
+        self._cache = {}          # (tool, sorted args) -> (success, text)
+        self.cache_hits = 0
+        self.last_call_cached = False
+        self._pending = {}        # request id -> Future awaiting its response
+        self._reader_task = None
+        self.transport = TRANSPORT
+        self._module = None       # navigator module in in-process mode
         
+    def _load_module(self):
+        """Import the navigator module for the in-process transport"""
+        script = _NAVIGATOR_DIRS[self.navigator_type] / 'index.py'
+        spec = importlib.util.spec_from_file_location(
+            f"_navigator_{self.navigator_type}", script)
+        module = importlib.util.module_from_spec(spec)
+        # Register before exec: import-time pickling of module-level
+        # classes (the petri EntityRecord build cache) needs the module
+        # importable under its spec name
+        sys.modules[spec.name] = module
+        # The navigator modules read their dataset path from argv
+        saved_argv = sys.argv
+        sys.argv = [str(script), self.dataset_path]
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(spec.name, None)
+            raise
+        finally:
+            sys.argv = saved_argv
+        return module
+
     async def start(self):
-        """Start the MCP server process"""
-        if self.navigator_type == "fsm":
-            cmd = ["uv", "--directory", 
-                   "/home/aaron/Projects/ai/mcp/semantic-petri-net/simulator/fsm-navigator",
-                   "run", "python", "index.py", self.dataset_path]
-        else:  # petri
-            cmd = ["uv", "--directory",
-                   "/home/aaron/Projects/ai/mcp/semantic-petri-net/simulator/petri-navigator", 
-                   "run", "python", "index.py", self.dataset_path]
-        
+        """Start the MCP server process (no-op when already running)"""
+        if self.transport == 'in-process':
+            if self._module is None:
+                self._module = self._load_module()
+            return
+        if self.process is not None:
+            return
+
+        # Spawn the interpreter directly from a repo-relative path - no
+        # uv resolver hop, no hardcoded absolute directories
+        script_dir = _NAVIGATOR_DIRS[self.navigator_type]
+        interpreter = os.environ.get("UV_PYTHON", sys.executable)
+
         self.process = await asyncio.create_subprocess_exec(
-            *cmd,
+            interpreter, str(script_dir / "index.py"), self.dataset_path,
+            cwd=script_dir,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
-        
-        # Initialize MCP session
-        await self._send_message({
-            "jsonrpc": "2.0",
-            "id": self._next_id(),
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "test-harness", "version": "1.0.0"}
-            }
-        })
-        
+
+        # One background task drains stdout and resolves responses by id,
+        # so requests can be pipelined without head-of-line readline waits
+        self._reader_task = asyncio.create_task(self._reader_loop())
+
+        # Initialize MCP session with the pre-encoded handshake frames
+        init_future = self._register(self._next_id())  # always id 1
+        self.process.stdin.write(_INIT_FRAME)
+        await self.process.stdin.drain()
+
         # Wait for initialize response
-        await self._read_message()
-        
+        await self._await_response(init_future)
+
         # Send initialized notification
-        await self._send_message({
-            "jsonrpc": "2.0",
-            "method": "notifications/initialized",
-            "params": {}
-        })
+        self.process.stdin.write(_INITIALIZED_FRAME)
+        await self.process.stdin.drain()
     
     def _next_id(self) -> int:
         self.request_id += 1
         return self.request_id
     
-    async def _send_message(self, message: dict):
-        """Send a JSON-RPC message"""
-        json_str = json.dumps(message) + "\n"
-        self.process.stdin.write(json_str.encode())
-        await self.process.stdin.drain()
-    
-    async def _read_message(self) -> Optional[dict]:
-        """Read a JSON-RPC response"""
+    def _register(self, msg_id: int) -> asyncio.Future:
+        """Create and park the future that will carry msg_id's response"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending[msg_id] = future
+        return future
+
+    async def _await_response(self, future) -> dict:
+        """Wait for a parked response, raising typed errors instead of
+        silently corrupting the id-response correspondence"""
         try:
-            line = await asyncio.wait_for(self.process.stdout.readline(), timeout=5.0)
-            if line:
-                return json.loads(line.decode().strip())
-        except (asyncio.TimeoutError, json.JSONDecodeError):
-            pass
-        return None
+            async with asyncio.timeout(5.0):
+                return await future
+        except asyncio.TimeoutError:
+            raise MCPTimeout(
+                f"{self.navigator_type} server response timed out") from None
+
+    async def _reader_loop(self):
+        """Continuously drain stdout and resolve pending futures by id"""
+        while True:
+            line = await self.process.stdout.readline()
+            if not line:
+                # Server EOF - fail whatever is still in flight
+                died = MCPServerDied(
+                    f"{self.navigator_type} server exited with requests in flight")
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(died)
+                self._pending.clear()
+                return
+            try:
+                message = _loads(line)
+            except ValueError:
+                continue
+            future = self._pending.pop(message.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+            # Messages without a pending id (notifications) are dropped
     
     async def call_tool(self, tool_name: str, arguments: dict = None) -> tuple[bool, str]:
         """Call a tool and return (success, result)"""
         if arguments is None:
             arguments = {}
-        
-        message = {
-            "jsonrpc": "2.0",
-            "id": self._next_id(),
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            }
-        }
-        
-        await self._send_message(message)
-        response = await self._read_message()
+
+        self.last_call_cached = False
+        cache_key = None
+        if tool_name in self.READ_ONLY_TOOLS:
+            cache_key = (tool_name, tuple(sorted(arguments.items())))
+            hit = self._cache.get(cache_key)
+            if hit is not None:
+                self.cache_hits += 1
+                self.last_call_cached = True
+                return hit
+        else:
+            # A mutation may change what the reads would render
+            self._cache.clear()
+
+        if self.transport == 'in-process':
+            handler = getattr(self._module, tool_name, None)
+            if handler is None:
+                return False, f"Error calling {tool_name}"
+            try:
+                out = (True, handler(**arguments))
+            except Exception as e:
+                return False, f"Error calling {tool_name}: {e}"
+            if cache_key is not None:
+                self._cache[cache_key] = out
+            return out
+
+        msg_id = self._next_id()
+        future = self._register(msg_id)
+        self.process.stdin.write(_encode_call(msg_id, tool_name, arguments))
+        await self.process.stdin.drain()
+        response = await self._await_response(future)
         
         if response and "result" in response:
             content = response["result"].get("content", [])
             if content and len(content) > 0:
-                return True, content[0].get("text", "")
-        
+                out = (True, content[0].get("text", ""))
+                if cache_key is not None:
+                    self._cache[cache_key] = out
+                return out
+
         return False, f"Error calling {tool_name}"
     
+    async def call_tools_batch(self, calls: list) -> list:
+        """Pipeline several tool calls through one stdin flush.
+
+        The stdio servers process requests strictly in order, so all
+        requests are written together and the responses are collected
+        afterwards - the pipe round-trip overhead is paid once per batch
+        instead of once per call. (True JSON-RPC array batching is not
+        supported by the servers; pipelining captures the same win.)
+        """
+        if self.transport == 'in-process':
+            return [await self.call_tool(tool, args) for tool, args in calls]
+
+        # Resolve reads from the cache first (in sequence order, so a
+        # mutation in the middle of a batch invalidates later reads) and
+        # pipeline only the misses.
+        results = [None] * len(calls)
+        to_send = []
+        for i, (tool_name, arguments) in enumerate(calls):
+            arguments = arguments or {}
+            cache_key = None
+            if tool_name in self.READ_ONLY_TOOLS:
+                cache_key = (tool_name, tuple(sorted(arguments.items())))
+                hit = self._cache.get(cache_key)
+                if hit is not None:
+                    self.cache_hits += 1
+                    results[i] = hit
+                    continue
+            else:
+                self._cache.clear()
+            to_send.append((i, tool_name, arguments, cache_key))
+
+        payload = []
+        futures = []
+        for _, tool_name, arguments, _key in to_send:
+            msg_id = self._next_id()
+            futures.append(self._register(msg_id))
+            payload.append(_encode_call(msg_id, tool_name, arguments))
+        if payload:
+            self.process.stdin.write(b"".join(payload))
+            await self.process.stdin.drain()
+
+        for (i, tool_name, _, cache_key), future in zip(to_send, futures):
+            response = await self._await_response(future)
+            if response and "result" in response:
+                content = response["result"].get("content", [])
+                if content and len(content) > 0:
+                    out = (True, content[0].get("text", ""))
+                    if cache_key is not None:
+                        self._cache[cache_key] = out
+                    results[i] = out
+                    continue
+            results[i] = (False, f"Error calling {tool_name}")
+        return results
+
     async def stop(self):
         """Stop the MCP server process"""
+        if self._reader_task:
+            self._reader_task.cancel()
         if self.process:
             self.process.terminate()
             await self.process.wait()
 
+# Started clients are pooled by (navigator type, dataset path) so that
+# repeated run_comparison invocations in one process reuse the warm
+# subprocess and MCP handshake instead of respawning per run.
+_CLIENT_POOL: Dict[Tuple[str, str], MCPClient] = {}
+
+def get_client(navigator_type: str, dataset_path: str, worker: int = 0) -> MCPClient:
+    key = (navigator_type, dataset_path, worker)
+    client = _CLIENT_POOL.get(key)
+    if client is None:
+        client = MCPClient(navigator_type, dataset_path)
+        _CLIENT_POOL[key] = client
+    return client
+
+def _shutdown_clients():
+    """Stop every pooled server at interpreter exit"""
+    if not _CLIENT_POOL:
+        return
+
+    async def _stop_all():
+        for client in _CLIENT_POOL.values():
+            await client.stop()
+
+    try:
+        asyncio.run(_stop_all())
+    except RuntimeError:
+        pass  # no usable event loop during shutdown
+
+atexit.register(_shutdown_clients)
+
 class FSMNavigatorTest:
     """Test FSM Navigator using real MCP calls"""
-    
-    def __init__(self, dataset_path: str):
+
+    # Scripted call tables per goal - the FSM must walk the hierarchy.
+    # A script whose final call carries completes_goal=False documents a
+    # goal the FSM cannot meet (e.g. the under-3-calls quick start).
+    GOAL_SCRIPTS = {
+        'goal-ship-feature': lambda e, p: (
+            Call("listProjects", {}, False),
+            Call("getProject", {"projectId": p}, False),
+            Call("listTasks", {"projectId": p}, False),
+            Call("getTask", {"taskId": e}, False),
+            Call("updateTaskState", {"taskId": e, "newState": "In Progress"}, False),
+            Call("updateTaskState", {"taskId": e, "newState": "Done"}, True),
+        ),
+        'goal-fix-critical-bug': lambda e, p: (
+            Call("navigateToRoot", {}, False),
+            Call("listProjects", {}, False),
+            Call("getProject", {"projectId": p}, False),
+            Call("listBugs", {"projectId": p}, False),
+            Call("getBug", {"bugId": e}, False),
+            Call("updateBugState", {"bugId": e, "newState": "In Progress"}, False),
+            Call("updateBugState", {"bugId": e, "newState": "Fixed"}, False),
+            Call("updateBugState", {"bugId": e, "newState": "Verified"}, True),
+        ),
+        'goal-complete-review': lambda e, p: (
+            Call("navigateToRoot", {}, False),
+            Call("listProjects", {}, False),
+            Call("getProject", {"projectId": p}, False),
+            Call("listTasks", {"projectId": p}, False),
+            Call("getTask", {"taskId": e}, False),
+            Call("updateTaskState", {"taskId": e, "newState": "Testing"}, True),
+        ),
+        'goal-quick-task-start': lambda e, p: (
+            Call("listProjects", {}, False),
+            Call("getProject", {"projectId": p}, False),
+            Call("listTasks", {"projectId": p}, False),
+            Call("getTask", {"taskId": e}, False),
+            Call("assignTask", {"taskId": e, "userId": "user-alice"}, False),
+            # Six calls - the under-3-calls constraint is unreachable
+            Call("updateTaskState", {"taskId": e, "newState": "Ready"}, False),
+        ),
+        'goal-reassign-work': lambda e, p: (
+            Call("navigateToRoot", {}, False),
+            Call("listProjects", {}, False),
+            Call("getProject", {"projectId": p}, False),
+            Call("listTasks", {"projectId": p}, False),
+            Call("getTask", {"taskId": e}, False),
+            Call("assignTask", {"taskId": e, "userId": "user-charlie"}, True),
+        ),
+    }
+
+    def __init__(self, dataset_path: str, worker: int = 0):
         self.metrics = NavigationMetrics("FSM Navigator")
-        self.client = MCPClient("fsm", dataset_path)
+        self.client = get_client("fsm", dataset_path, worker)
         self.current_location = "root"
-    
+        # First project resolved once - no per-goal list build
+        self._first_project_id = next(
+            iter(load_dataset(dataset_path)['entities']['projects']), None)
+
     async def initialize(self):
         await self.client.start()
-    
+
     async def cleanup(self):
-        await self.client.stop()
-    
+        pass  # pooled clients stay warm; atexit stops them
+
     async def achieve_goal(self, goal: Dict[str, Any]) -> bool:
-        """Attempt to achieve a goal using FSM navigation"""
-        self.metrics.start_new_goal()
-        
-        if goal['id'] == 'goal-ship-feature':
-            return await self._complete_task(goal['entity'])
-        elif goal['id'] == 'goal-fix-critical-bug':
-            return await self._fix_bug(goal['entity'])
-        elif goal['id'] == 'goal-complete-review':
-            return await self._update_task_state(goal['entity'])
-        elif goal['id'] == 'goal-quick-task-start':
-            return await self._start_task_efficiently(goal['entity'])
-        elif goal['id'] == 'goal-reassign-work':
-            return await self._reassign_work_item(goal['entity'])
-        
-        return False
-    
-    async def _complete_task(self, task_id: str) -> bool:
-        """Goal: Complete a task through all states"""
-        try:
-            # Get first project for navigation
-            dataset = DATASETS[self.client.dataset_name]
-            project_id = list(dataset['entities']['projects'].keys())[0]
-            
-            # FSM requires navigation hierarchy
-            success, result = await self.client.call_tool("listProjects")
-            self.metrics.add_tool_call("listProjects", result)
-            
-            success, result = await self.client.call_tool("getProject", {"projectId": project_id})
-            self.metrics.add_tool_call("getProject", result)
-            
-            success, result = await self.client.call_tool("listTasks", {"projectId": project_id})
-            self.metrics.add_tool_call("listTasks", result)
-            
-            success, result = await self.client.call_tool("getTask", {"taskId": task_id})
-            self.metrics.add_tool_call("getTask", result)
-            
-            # Try to advance task to completion (In Progress -> Done)
-            success, result = await self.client.call_tool("updateTaskState", 
-                                                        {"taskId": task_id, "newState": "In Progress"})
-            self.metrics.add_tool_call("updateTaskState", result)
-            
-            success, result = await self.client.call_tool("updateTaskState", 
-                                                        {"taskId": task_id, "newState": "Done"})
-            self.metrics.add_tool_call("updateTaskState", result)
-            
-            if success:
-                self.metrics.complete_goal('goal-ship-feature')
-                return True
-        except Exception as e:
-            self.metrics.errors_encountered += 1
-        
-        return False
-    
-    async def _fix_critical_bug(self) -> bool:
-        """Goal: Fix bug-login"""
-        try:
-            # Navigate to bugs (must go back to root first in FSM)
-            success, result = await self.client.call_tool("navigateToRoot")
-            self.metrics.add_tool_call("navigateToRoot", result)
-            
-            success, result = await self.client.call_tool("listProjects")
-            self.metrics.add_tool_call("listProjects", result)
-            
-            success, result = await self.client.call_tool("getProject", {"projectId": "project-web"})
-            self.metrics.add_tool_call("getProject", result)
-            
-            success, result = await self.client.call_tool("listBugs", {"projectId": "project-web"})
-            self.metrics.add_tool_call("listBugs", result)
-            
-            success, result = await self.client.call_tool("getBug", {"bugId": "bug-login"})
-            self.metrics.add_tool_call("getBug", result)
-            
-            # Update bug states
-            success, result = await self.client.call_tool("updateBugState", 
-                                                        {"bugId": "bug-login", "newState": "In Progress"})
-            self.metrics.add_tool_call("updateBugState", result)
-            
-            success, result = await self.client.call_tool("updateBugState", 
-                                                        {"bugId": "bug-login", "newState": "Fixed"})
-            self.metrics.add_tool_call("updateBugState", result)
-            
-            success, result = await self.client.call_tool("updateBugState", 
-                                                        {"bugId": "bug-login", "newState": "Verified"})
-            self.metrics.add_tool_call("updateBugState", result)
-            
-            if success:
-                self.metrics.complete_goal('goal-fix-critical-bug')
-                return True
-        except Exception as e:
-            self.metrics.errors_encountered += 1
-        
-        return False
-    
-    async def _complete_code_review(self) -> bool:
-        """Goal: Move task-api from Review to Testing"""
-        try:
-            # Navigate to the task
-            success, result = await self.client.call_tool("navigateToRoot")
-            self.metrics.add_tool_call("navigateToRoot", result)
-            
-            success, result = await self.client.call_tool("listProjects")
-            self.metrics.add_tool_call("listProjects", result)
-            
-            success, result = await self.client.call_tool("getProject", {"projectId": "project-web"})
-            self.metrics.add_tool_call("getProject", result)
-            
-            success, result = await self.client.call_tool("listTasks", {"projectId": "project-web"})
-            self.metrics.add_tool_call("listTasks", result)
-            
-            success, result = await self.client.call_tool("getTask", {"taskId": "task-api"})
-            self.metrics.add_tool_call("getTask", result)
-            
-            success, result = await self.client.call_tool("updateTaskState", 
-                                                        {"taskId": "task-api", "newState": "Testing"})
-            self.metrics.add_tool_call("updateTaskState", result)
-            
-            if success:
-                self.metrics.complete_goal('goal-complete-review')
-                return True
-        except Exception as e:
-            self.metrics.errors_encountered += 1
-        
-        return False
-    
-    async def _start_task_efficiently(self) -> bool:
-        """Goal: Start any open task in under 3 calls (SHOULD FAIL for FSM)"""
-        try:
-            # FSM cannot do this efficiently - requires navigation
-            success, result = await self.client.call_tool("listProjects")
-            self.metrics.add_tool_call("listProjects", result)
-            
-            success, result = await self.client.call_tool("getProject", {"projectId": "project-web"})
-            self.metrics.add_tool_call("getProject", result)
-            
-            success, result = await self.client.call_tool("listTasks", {"projectId": "project-web"})
-            self.metrics.add_tool_call("listTasks", result)
-            
-            success, result = await self.client.call_tool("getTask", {"taskId": "task-deploy"})
-            self.metrics.add_tool_call("getTask", result)
-            
-            success, result = await self.client.call_tool("assignTask", 
-                                                        {"taskId": "task-deploy", "userId": "user-alice"})
-            self.metrics.add_tool_call("assignTask", result)
-            
-            success, result = await self.client.call_tool("updateTaskState", 
-                                                        {"taskId": "task-deploy", "newState": "Ready"})
-            self.metrics.add_tool_call("updateTaskState", result)
-            
-            # This took 6 calls, not under 3 - FSM limitation
-            self.metrics.errors_encountered += 1
-            return False
-        except Exception as e:
-            self.metrics.errors_encountered += 1
-        
-        return False
-    
-    async def _reassign_work_item(self) -> bool:
-        """Goal: Reassign task-ui"""
-        try:
-            # Navigate to task
-            success, result = await self.client.call_tool("navigateToRoot")
-            self.metrics.add_tool_call("navigateToRoot", result)
-            
-            success, result = await self.client.call_tool("listProjects")
-            self.metrics.add_tool_call("listProjects", result)
-            
-            success, result = await self.client.call_tool("getProject", {"projectId": "project-web"})
-            self.metrics.add_tool_call("getProject", result)
-            
-            success, result = await self.client.call_tool("listTasks", {"projectId": "project-web"})
-            self.metrics.add_tool_call("listTasks", result)
-            
-            success, result = await self.client.call_tool("getTask", {"taskId": "task-ui"})
-            self.metrics.add_tool_call("getTask", result)
-            
-            success, result = await self.client.call_tool("assignTask", 
-                                                        {"taskId": "task-ui", "userId": "user-charlie"})
-            self.metrics.add_tool_call("assignTask", result)
-            
-            if success:
-                self.metrics.complete_goal('goal-reassign-work')
-                return True
-        except Exception as e:
-            self.metrics.errors_encountered += 1
-        
-        return False
+        """Attempt to achieve a goal by running its scripted call table"""
+        return await _run_goal_script(self, goal)
 
 class PetriNetNavigatorTest:
     """Test Petri Net Navigator using real MCP calls"""
-    
-    def __init__(self, dataset_path: str):
+
+    # Semantic multi-entry operations - no navigation scaffolding
+    GOAL_SCRIPTS = {
+        'goal-ship-feature': lambda e, p: (
+            Call("startWorkingOn", {"identifier": e}, False),
+            Call("completeItem", {"entityId": e}, True),
+        ),
+        'goal-fix-critical-bug': lambda e, p: (
+            Call("getBugInfo", {"bugId": e}, False),
+            Call("startWorkingOn", {"identifier": e}, False),
+            Call("completeItem", {"entityId": e}, True),
+        ),
+        'goal-complete-review': lambda e, p: (
+            Call("updateState", {"entityId": e, "newState": "Testing"}, True),
+        ),
+        'goal-quick-task-start': lambda e, p: (
+            Call("startWorkingOn", {"identifier": e}, True),
+        ),
+        'goal-reassign-work': lambda e, p: (
+            Call("reassignItem", {"entityId": e, "fromUser": "user-alice",
+                                  "toUser": "user-charlie"}, True),
+        ),
+    }
+
+    def __init__(self, dataset_path: str, worker: int = 0):
         self.metrics = NavigationMetrics("Petri Net Navigator")
-        self.client = MCPClient("petri", dataset_path)
-    
+        self.client = get_client("petri", dataset_path, worker)
+        self._first_project_id = next(
+            iter(load_dataset(dataset_path)['entities']['projects']), None)
+
     async def initialize(self):
         await self.client.start()
-    
+
     async def cleanup(self):
-        await self.client.stop()
-    
+        pass  # pooled clients stay warm; atexit stops them
+
     async def achieve_goal(self, goal: Dict[str, Any]) -> bool:
-        """Attempt to achieve a goal using Petri Net navigation"""
-        self.metrics.start_new_goal()
-        
-        if goal['id'] == 'goal-ship-feature':
-            return await self._complete_task(goal['entity'])
-        elif goal['id'] == 'goal-fix-critical-bug':
-            return await self._fix_bug(goal['entity'])
-        elif goal['id'] == 'goal-complete-review':
-            return await self._update_task_state(goal['entity'])
-        elif goal['id'] == 'goal-quick-task-start':
-            return await self._start_task_efficiently(goal['entity'])
-        elif goal['id'] == 'goal-reassign-work':
-            return await self._reassign_work_item(goal['entity'])
-        
-        return False
-    
-    async def _complete_task(self, task_id: str) -> bool:
-        """Goal: Complete a task using semantic operations"""
-        try:
-            # Direct multi-entry access with semantic hints
-            success, result = await self.client.call_tool("startWorkingOn", {"identifier": task_id})
-            self.metrics.add_tool_call("startWorkingOn", result)
-            
-            # Complete in one semantic operation (jumps through states)
-            success, result = await self.client.call_tool("completeItem", {"entityId": task_id})
-            self.metrics.add_tool_call("completeItem", result)
-            
-            if success:
-                self.metrics.complete_goal('goal-ship-feature')
-                return True
-        except Exception as e:
-            self.metrics.errors_encountered += 1
-        
-        return False
-    
-    async def _fix_bug(self, bug_id: str) -> bool:
-        """Goal: Fix bug using semantic operations"""
-        try:
-            # Direct access to bug
-            success, result = await self.client.call_tool("getBugInfo", {"bugId": bug_id})
-            self.metrics.add_tool_call("getBugInfo", result)
-            
-            # Start working on it
-            success, result = await self.client.call_tool("startWorkingOn", {"identifier": bug_id})
-            self.metrics.add_tool_call("startWorkingOn", result)
-            
-            # Complete bug fix
-            success, result = await self.client.call_tool("completeItem", {"entityId": bug_id})
-            self.metrics.add_tool_call("completeItem", result)
-            
-            if success:
-                self.metrics.complete_goal('goal-fix-critical-bug')
-                return True
-        except Exception as e:
-            self.metrics.errors_encountered += 1
-        
-        return False
-    
-    async def _complete_code_review(self) -> bool:
-        """Goal: Move task-api from Review to Testing"""
-        try:
-            # Direct state update
-            success, result = await self.client.call_tool("updateState", 
-                                                        {"entityId": "task-api", "newState": "Testing"})
-            self.metrics.add_tool_call("updateState", result)
-            
-            if success:
-                self.metrics.complete_goal('goal-complete-review')
-                return True
-        except Exception as e:
-            self.metrics.errors_encountered += 1
-        
+        """Attempt to achieve a goal by running its scripted call table"""
+        return await _run_goal_script(self, goal)
+
+async def _run_goal_script(navigator, goal: Dict[str, Any]) -> bool:
+    """Run a navigator's scripted call table for one goal"""
+    navigator.metrics.start_new_goal()
+
+    entity = goal.get('entity') or goal.get('condition', {}).get('entity')
+    build_script = navigator.GOAL_SCRIPTS.get(goal['id'])
+    if build_script is None or entity is None:
         return False
-    
-    async def _start_task_efficiently(self) -> bool:
-        """Goal: Start any open task in under 3 calls (EASY for Petri Net)"""
-        try:
-            # Single semantic operation
-            success, result = await self.client.call_tool("startWorkingOn", {"identifier": "task-deploy"})
-            self.metrics.add_tool_call("startWorkingOn", result)
-            
-            # Only 1 call needed!
-            if success:
-                self.metrics.complete_goal('goal-quick-task-start')
-                return True
-        except Exception as e:
-            self.metrics.errors_encountered += 1
-        
+
+    script = build_script(entity, navigator._first_project_id)
+    try:
+        results = await navigator.client.call_tools_batch(
+            [(call.tool, call.args) for call in script])
+        for call, (success, result) in zip(script, results):
+            navigator.metrics.add_tool_call(call.tool, result)
+
+        if script[-1].completes_goal and results and results[-1][0]:
+            navigator.metrics.complete_goal(goal['id'])
+            return True
+        if not script[-1].completes_goal:
+            # Scripted architectural failure (counts against the navigator)
+            navigator.metrics.errors_encountered += 1
         return False
-    
-    async def _reassign_work_item(self) -> bool:
-        """Goal: Reassign task-ui"""
-        try:
-            # Direct reassignment without navigation
-            success, result = await self.client.call_tool("reassignItem", 
-                                                        {"entityId": "task-ui", 
-                                                         "fromUser": "user-alice", 
-                                                         "toUser": "user-charlie"})
-            self.metrics.add_tool_call("reassignItem", result)
-            
-            if success:
-                self.metrics.complete_goal('goal-reassign-work')
-                return True
-        except Exception as e:
-            self.metrics.errors_encountered += 1
-        
+    except Exception:
+        navigator.metrics.errors_encountered += 1
         return False
 
-def enumerate_all_tests(dataset: dict) -> list:
-    """Enumerate ALL possible tests from the dataset systematically"""
-    tests = []
-    test_id = 0
-    
+@lru_cache(maxsize=None)
+def _terminal_states(transitions_key) -> tuple:
+    """States with no outgoing transitions, computed once per unique
+    transition schema (entities typically share a handful of workflows)"""
+    return tuple(state for state, targets in transitions_key if not targets)
+
+
+def _transitions_key(valid_transitions) -> tuple:
+    return tuple(sorted((state, tuple(targets))
+                        for state, targets in valid_transitions.items()))
+
+
+def enumerate_all_tests(dataset: dict):
+    """Yield every possible test from the dataset systematically.
+
+    A generator so huge enumerations (reassignments grow with U^2) are
+    streamed into the sampler instead of materialized."""
+    test_ids = itertools.count(1)
+
     projects = list(dataset['entities']['projects'].keys())
-    tasks = list(dataset['entities']['tasks'].keys()) 
-    bugs = list(dataset['entities']['bugs'].keys())
+    tasks = dataset['entities']['tasks']
+    bugs = dataset['entities']['bugs']
     users = list(dataset['entities']['users'].keys())
-    
-    # 1. Single state transitions for each task
-    for task_id in tasks:
-        task = dataset['entities']['tasks'][task_id]
-        current_state = task['state']
-        valid_transitions = task.get('validTransitions', {})
-        project_id = task.get('project', projects[0] if projects else None)
-        
-        for target_state in valid_transitions.get(current_state, []):
-            test_id += 1
-            tests.append({
-                'id': f'test-{test_id:03d}',
-                'name': f'Transition {task["name"]}: {current_state} → {target_state}',
-                'entity_type': 'task',
-                'entity_id': task_id,
-                'project_id': project_id,
-                'current_state': current_state,
-                'target_state': target_state,
-                'test_type': 'single_transition',
-                'complexity': 'simple'
-            })
-    
-    # 2. Single state transitions for each bug
-    for bug_id in bugs:
-        bug = dataset['entities']['bugs'][bug_id]
-        current_state = bug['state']
-        valid_transitions = bug.get('validTransitions', {})
-        project_id = bug.get('project', projects[0] if projects else None)
-        
-        for target_state in valid_transitions.get(current_state, []):
-            test_id += 1
-            tests.append({
-                'id': f'test-{test_id:03d}',
-                'name': f'Transition {bug["name"]}: {current_state} → {target_state}',
-                'entity_type': 'bug',
-                'entity_id': bug_id,
-                'project_id': project_id,
-                'current_state': current_state,
-                'target_state': target_state,
-                'test_type': 'single_transition',
-                'complexity': 'simple'
-            })
-    
-    # 3. Multi-step workflows (complete to final state)
-    for task_id in tasks:
-        task = dataset['entities']['tasks'][task_id]
-        current_state = task['state']
-        valid_transitions = task.get('validTransitions', {})
-        project_id = task.get('project', projects[0] if projects else None)
-        
-        # Find terminal states (states with no outgoing transitions)
-        terminal_states = []
-        for state, transitions in valid_transitions.items():
-            if not transitions:  # No outgoing transitions
-                terminal_states.append(state)
-        
-        for terminal_state in terminal_states:
-            if terminal_state != current_state:
-                test_id += 1
-                tests.append({
-                    'id': f'test-{test_id:03d}',
-                    'name': f'Complete {task["name"]} to {terminal_state}',
-                    'entity_type': 'task',
-                    'entity_id': task_id,
-                    'project_id': project_id,
-                    'current_state': current_state,
-                    'target_state': terminal_state,
-                    'test_type': 'completion',
-                    'complexity': 'complex'
-                })
-    
-    # 4. Multi-step workflows for bugs
-    for bug_id in bugs:
-        bug = dataset['entities']['bugs'][bug_id]
-        current_state = bug['state']
-        valid_transitions = bug.get('validTransitions', {})
-        project_id = bug.get('project', projects[0] if projects else None)
-        
-        # Find terminal states
-        terminal_states = []
-        for state, transitions in valid_transitions.items():
-            if not transitions:
-                terminal_states.append(state)
-        
-        for terminal_state in terminal_states:
-            if terminal_state != current_state:
-                test_id += 1
-                tests.append({
-                    'id': f'test-{test_id:03d}',
-                    'name': f'Resolve {bug["name"]} to {terminal_state}',
-                    'entity_type': 'bug',
-                    'entity_id': bug_id,
+    default_project = projects[0] if projects else None
+
+    # 1-2. Single state transitions for each task and bug
+    for entity_type, collection in (('task', tasks), ('bug', bugs)):
+        verb = 'Transition'
+        for entity_id, entity in collection.items():
+            current_state = entity['state']
+            valid_transitions = entity.get('validTransitions', {})
+            project_id = entity.get('project', default_project)
+
+            for target_state in valid_transitions.get(current_state, []):
+                yield {
+                    'id': f'test-{next(test_ids):03d}',
+                    'name': f'{verb} {entity["name"]}: {current_state} → {target_state}',
+                    'entity_type': entity_type,
+                    'entity_id': entity_id,
                     'project_id': project_id,
                     'current_state': current_state,
-                    'target_state': terminal_state,
-                    'test_type': 'completion',
-                    'complexity': 'complex'
-                })
-    
+                    'target_state': target_state,
+                    'test_type': 'single_transition',
+                    'complexity': 'simple'
+                }
+
+    # 3-4. Multi-step workflows (complete to a terminal state)
+    for entity_type, collection, verb in (('task', tasks, 'Complete'),
+                                          ('bug', bugs, 'Resolve')):
+        for entity_id, entity in collection.items():
+            current_state = entity['state']
+            valid_transitions = entity.get('validTransitions', {})
+            project_id = entity.get('project', default_project)
+
+            # Terminal states memoized per unique transition schema
+            terminal_states = _terminal_states(_transitions_key(valid_transitions))
+
+            for terminal_state in terminal_states:
+                if terminal_state != current_state:
+                    yield {
+                        'id': f'test-{next(test_ids):03d}',
+                        'name': f'{verb} {entity["name"]} to {terminal_state}',
+                        'entity_type': entity_type,
+                        'entity_id': entity_id,
+                        'project_id': project_id,
+                        'current_state': current_state,
+                        'target_state': terminal_state,
+                        'test_type': 'completion',
+                        'complexity': 'complex'
+                    }
+
     # 5. Direct access efficiency tests (bypass navigation)
-    for task_id in tasks:
-        task = dataset['entities']['tasks'][task_id]
-        test_id += 1
-        tests.append({
-            'id': f'test-{test_id:03d}',
+    for task_id, task in tasks.items():
+        yield {
+            'id': f'test-{next(test_ids):03d}',
             'name': f'Direct Access: {task["name"]}',
             'entity_type': 'task',
             'entity_id': task_id,
             'test_type': 'direct_access',
             'complexity': 'efficiency',
             'description': 'Test navigation bypass capabilities'
-        })
-    
-    # 6. Reassignment tests (if multiple users)
+        }
+
+    # 6. Reassignment tests (if multiple users) - permutations replaces
+    # the nested index loops with their i != j branch
     if len(users) > 1:
-        for task_id in tasks:
-            task = dataset['entities']['tasks'][task_id]
-            for i, from_user in enumerate(users):
-                for j, to_user in enumerate(users):
-                    if i != j:  # Don't reassign to same user
-                        test_id += 1
-                        tests.append({
-                            'id': f'test-{test_id:03d}',
-                            'name': f'Reassign {task["name"]}: {from_user} → {to_user}',
-                            'entity_type': 'task',
-                            'entity_id': task_id,
-                            'from_user': from_user,
-                            'to_user': to_user,
-                            'test_type': 'reassignment',
-                            'complexity': 'simple'
-                        })
-        
-        for bug_id in bugs:
-            bug = dataset['entities']['bugs'][bug_id]
-            for i, from_user in enumerate(users):
-                for j, to_user in enumerate(users):
-                    if i != j:
-                        test_id += 1
-                        tests.append({
-                            'id': f'test-{test_id:03d}',
-                            'name': f'Reassign {bug["name"]}: {from_user} → {to_user}',
-                            'entity_type': 'bug',
-                            'entity_id': bug_id,
-                            'from_user': from_user,
-                            'to_user': to_user,
-                            'test_type': 'reassignment',
-                            'complexity': 'simple'
-                        })
-    
-    return tests
+        for entity_type, collection in (('task', tasks), ('bug', bugs)):
+            for entity_id, entity in collection.items():
+                for from_user, to_user in itertools.permutations(users, 2):
+                    yield {
+                        'id': f'test-{next(test_ids):03d}',
+                        'name': f'Reassign {entity["name"]}: {from_user} → {to_user}',
+                        'entity_type': entity_type,
+                        'entity_id': entity_id,
+                        'from_user': from_user,
+                        'to_user': to_user,
+                        'test_type': 'reassignment',
+                        'complexity': 'simple'
+                    }
+
+def select_tests(all_tests, num_tests: int, seed: int = None):
+    """Reservoir-sample num_tests from an iterable of tests without
+    materializing the full enumeration (Vitter's Algorithm R).
+
+    Returns (selected tests sorted by id, total tests seen)."""
+    rng = random.Random(seed)
+    reservoir = []
+    total = 0
+
+    for test in all_tests:
+        total += 1
+        if len(reservoir) < num_tests:
+            reservoir.append(test)
+        else:
+            slot = rng.randrange(total)
+            if slot < num_tests:
+                reservoir[slot] = test
 
-def select_tests(all_tests: list, num_tests: int, seed: int = None) -> list:
-    """Select a subset of tests using seeded randomization for reproducibility"""
-    if seed is not None:
-        random.seed(seed)
-    
-    if num_tests >= len(all_tests):
-        # If requesting more tests than available, return all
-        return all_tests.copy()
-    
-    # Random sample without replacement
-    selected = random.sample(all_tests, num_tests)
-    
     # Sort by ID to maintain some consistency in output order
-    selected.sort(key=lambda x: x['id'])
-    
-    return selected
+    reservoir.sort(key=lambda t: t['id'])
+    return reservoir, total
 
 def generate_test_scenarios(dataset: dict, num_tests: int = 5, seed: int = None) -> list:
     """Generate test scenarios with enumeration and seeded selection"""
-    all_tests = enumerate_all_tests(dataset)
-    selected_tests = select_tests(all_tests, num_tests, seed)
-    return selected_tests
+    selected, _ = select_tests(enumerate_all_tests(dataset), num_tests, seed)
+    return selected
 
 async def execute_scenario_fsm(navigator, scenario):
     """Execute a scenario using FSM navigator"""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     navigator.metrics.start_new_goal()
-    
+    success = False
+
     try:
-        test_type = scenario['test_type']
-        entity_type = scenario.get('entity_type', 'task')
-        
-        if test_type in ['single_transition', 'completion']:
-            if entity_type == 'task':
-                success = await _fsm_update_task_state(navigator, scenario)
-            elif entity_type == 'bug':
-                success = await _fsm_update_bug_state(navigator, scenario)
-            else:
-                success = False
-        elif test_type == 'direct_access':
-            success = await _fsm_direct_access(navigator, scenario)
-        elif test_type == 'reassignment':
-            success = await _fsm_reassign(navigator, scenario)
-        else:
-            success = False
-        
-        elapsed = time.time() - start_time
-        calls = len(navigator.metrics.paths_taken[-1]) if navigator.metrics.paths_taken else 0
-        return success, calls, elapsed
-        
-    except Exception as e:
+        handler = _FSM_SCENARIO_EXECUTORS.get(
+            (scenario['test_type'], scenario.get('entity_type', 'task')))
+        if handler is not None:
+            success = await handler(navigator, scenario)
+    except Exception:
         navigator.metrics.errors_encountered += 1
-        elapsed = time.time() - start_time
-        calls = len(navigator.metrics.paths_taken[-1]) if navigator.metrics.paths_taken else 0
-        return False, calls, elapsed
+        success = False
+
+    # Single exit: integer ns clock, converted to seconds at the boundary.
+    # The accumulator update happens inside this coroutine after all its
+    # awaits, so concurrent gathers cannot interleave the read-add-store.
+    elapsed = (time.perf_counter_ns() - start_ns) * 1e-9
+    navigator.metrics.time_elapsed += elapsed
+    return success, navigator.metrics.current_goal_calls, elapsed
 
 async def execute_scenario_petri(navigator, scenario):
     """Execute a scenario using Petri navigator"""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     navigator.metrics.start_new_goal()
-    
+    success = False
+
     try:
-        test_type = scenario['test_type']
-        entity_type = scenario.get('entity_type', 'task')
-        
-        if test_type in ['single_transition', 'completion']:
-            if entity_type == 'task':
-                success = await _petri_update_task_state(navigator, scenario)
-            elif entity_type == 'bug':
-                success = await _petri_update_bug_state(navigator, scenario)
-            else:
-                success = False
-        elif test_type == 'direct_access':
-            success = await _petri_direct_access(navigator, scenario)
-        elif test_type == 'reassignment':
-            success = await _petri_reassign(navigator, scenario)
-        else:
-            success = False
-        
-        elapsed = time.time() - start_time
-        calls = len(navigator.metrics.paths_taken[-1]) if navigator.metrics.paths_taken else 0
-        return success, calls, elapsed
-        
-    except Exception as e:
+        handler = _PETRI_SCENARIO_EXECUTORS.get(
+            (scenario['test_type'], scenario.get('entity_type', 'task')))
+        if handler is not None:
+            success = await handler(navigator, scenario)
+    except Exception:
         navigator.metrics.errors_encountered += 1
-        elapsed = time.time() - start_time
-        calls = len(navigator.metrics.paths_taken[-1]) if navigator.metrics.paths_taken else 0
-        return False, calls, elapsed
+        success = False
+
+    # Single exit: integer ns clock, converted to seconds at the boundary.
+    # The accumulator update happens inside this coroutine after all its
+    # awaits, so concurrent gathers cannot interleave the read-add-store.
+    elapsed = (time.perf_counter_ns() - start_ns) * 1e-9
+    navigator.metrics.time_elapsed += elapsed
+    return success, navigator.metrics.current_goal_calls, elapsed
 
 # FSM scenario implementations
 async def _fsm_update_task_state(navigator, scenario):
-    """FSM: Update task state through hierarchy"""
-    # FSM requires navigation to the entity first
-    success, result = await navigator.client.call_tool("listProjects")
-    navigator.metrics.add_tool_call("listProjects", result)
-    
+    """FSM: Update task state through hierarchy (one pipelined batch -
+    the navigation arguments don't depend on earlier responses)"""
+    calls = [("listProjects", {})]
     if 'project_id' in scenario:
-        success, result = await navigator.client.call_tool("getProject", {"projectId": scenario['project_id']})
-        navigator.metrics.add_tool_call("getProject", result)
-    
-    success, result = await navigator.client.call_tool("getTask", {"taskId": scenario['entity_id']})
-    navigator.metrics.add_tool_call("getTask", result)
-    
-    success, result = await navigator.client.call_tool("updateTaskState", 
-                                                      {"taskId": scenario['entity_id'], "newState": scenario['target_state']})
-    navigator.metrics.add_tool_call("updateTaskState", result)
-    
-    return success
+        calls.append(("getProject", {"projectId": scenario['project_id']}))
+    calls.append(("getTask", {"taskId": scenario['entity_id']}))
+    calls.append(("updateTaskState", {"taskId": scenario['entity_id'],
+                                      "newState": scenario['target_state']}))
+
+    results = await navigator.client.call_tools_batch(calls)
+    for (tool_name, _), (success, result) in zip(calls, results):
+        navigator.metrics.add_tool_call(tool_name, result)
+
+    return results[-1][0]
 
 async def _fsm_update_bug_state(navigator, scenario):
-    """FSM: Update bug state through hierarchy"""
-    success, result = await navigator.client.call_tool("listProjects")
-    navigator.metrics.add_tool_call("listProjects", result)
-    
+    """FSM: Update bug state through hierarchy (one pipelined batch)"""
+    calls = [("listProjects", {})]
     if 'project_id' in scenario:
-        success, result = await navigator.client.call_tool("getProject", {"projectId": scenario['project_id']})
-        navigator.metrics.add_tool_call("getProject", result)
-    
-    success, result = await navigator.client.call_tool("getBug", {"bugId": scenario['entity_id']})
-    navigator.metrics.add_tool_call("getBug", result)
-    
-    success, result = await navigator.client.call_tool("updateBugState", 
-                                                      {"bugId": scenario['entity_id'], "newState": scenario['target_state']})
-    navigator.metrics.add_tool_call("updateBugState", result)
-    
-    return success
+        calls.append(("getProject", {"projectId": scenario['project_id']}))
+    calls.append(("getBug", {"bugId": scenario['entity_id']}))
+    calls.append(("updateBugState", {"bugId": scenario['entity_id'],
+                                     "newState": scenario['target_state']}))
+
+    results = await navigator.client.call_tools_batch(calls)
+    for (tool_name, _), (success, result) in zip(calls, results):
+        navigator.metrics.add_tool_call(tool_name, result)
+
+    return results[-1][0]
 
 async def _fsm_direct_access(navigator, scenario):
     """FSM: Try direct access (should fail due to navigation requirements)"""
@@ -776,74 +803,111 @@ async def _fsm_direct_access(navigator, scenario):
     return "Error" not in result
 
 async def _fsm_reassign(navigator, scenario):
-    """FSM: Reassign entity through hierarchy"""
-    success, result = await navigator.client.call_tool("listProjects")
-    navigator.metrics.add_tool_call("listProjects", result)
-    
+    """FSM: Reassign entity through hierarchy (one pipelined batch)"""
     if scenario['entity_type'] == 'task':
-        success, result = await navigator.client.call_tool("getTask", {"taskId": scenario['entity_id']})
-        navigator.metrics.add_tool_call("getTask", result)
-        
-        success, result = await navigator.client.call_tool("assignTask", 
-                                                          {"taskId": scenario['entity_id'], "userId": scenario['to_user']})
-        navigator.metrics.add_tool_call("assignTask", result)
+        calls = [("listProjects", {}),
+                 ("getTask", {"taskId": scenario['entity_id']}),
+                 ("assignTask", {"taskId": scenario['entity_id'],
+                                 "userId": scenario['to_user']})]
     else:
-        success, result = await navigator.client.call_tool("getBug", {"bugId": scenario['entity_id']})
-        navigator.metrics.add_tool_call("getBug", result)
-        
-        success, result = await navigator.client.call_tool("assignBug", 
-                                                          {"bugId": scenario['entity_id'], "userId": scenario['to_user']})
-        navigator.metrics.add_tool_call("assignBug", result)
-    
-    return success
+        calls = [("listProjects", {}),
+                 ("getBug", {"bugId": scenario['entity_id']}),
+                 ("assignBug", {"bugId": scenario['entity_id'],
+                                "userId": scenario['to_user']})]
+
+    results = await navigator.client.call_tools_batch(calls)
+    for (tool_name, _), (success, result) in zip(calls, results):
+        navigator.metrics.add_tool_call(tool_name, result)
+
+    return results[-1][0]
 
 # Petri scenario implementations  
-async def _petri_update_task_state(navigator, scenario):
-    """Petri: Direct task state update"""
-    if scenario['test_type'] == 'completion':
-        # Use semantic completion operation
-        success, result = await navigator.client.call_tool("completeItem", {"entityId": scenario['entity_id']})
-        navigator.metrics.add_tool_call("completeItem", result)
-    else:
-        # Direct state update
-        success, result = await navigator.client.call_tool("updateState", 
-                                                          {"entityId": scenario['entity_id'], "newState": scenario['target_state']})
-        navigator.metrics.add_tool_call("updateState", result)
-    
-    return success
+async def _petri_update_state(navigator, scenario):
+    """Petri: Direct state update - tasks and bugs share one path"""
+    client = navigator.client
+    add_tool_call = navigator.metrics.add_tool_call
 
-async def _petri_update_bug_state(navigator, scenario):
-    """Petri: Direct bug state update"""
     if scenario['test_type'] == 'completion':
-        # Use semantic completion operation  
-        success, result = await navigator.client.call_tool("completeItem", {"entityId": scenario['entity_id']})
-        navigator.metrics.add_tool_call("completeItem", result)
+        # Use semantic completion operation
+        success, result = await client.call_tool("completeItem", {"entityId": scenario['entity_id']})
+        add_tool_call("completeItem", result, cached=client.last_call_cached)
     else:
         # Direct state update
-        success, result = await navigator.client.call_tool("updateState", 
-                                                          {"entityId": scenario['entity_id'], "newState": scenario['target_state']})
-        navigator.metrics.add_tool_call("updateState", result)
+        success, result = await client.call_tool("updateState", 
+                                                 {"entityId": scenario['entity_id'], "newState": scenario['target_state']})
+        add_tool_call("updateState", result, cached=client.last_call_cached)
     
     return success
 
 async def _petri_direct_access(navigator, scenario):
     """Petri: Direct access (should succeed)"""
-    success, result = await navigator.client.call_tool("startWorkingOn", {"identifier": scenario['entity_id']})
-    navigator.metrics.add_tool_call("startWorkingOn", result)
+    client = navigator.client
+    success, result = await client.call_tool("startWorkingOn", {"identifier": scenario['entity_id']})
+    navigator.metrics.add_tool_call("startWorkingOn", result, cached=client.last_call_cached)
     
     return success
 
 async def _petri_reassign(navigator, scenario):
     """Petri: Direct reassignment"""
-    success, result = await navigator.client.call_tool("reassignItem", 
-                                                      {"entityId": scenario['entity_id'],
-                                                       "fromUser": scenario['from_user'],
-                                                       "toUser": scenario['to_user']})
-    navigator.metrics.add_tool_call("reassignItem", result)
+    client = navigator.client
+    # The server only echoes fromUser - don't require it on the scenario
+    success, result = await client.call_tool("reassignItem", 
+                                             {"entityId": scenario['entity_id'],
+                                              "fromUser": scenario.get('from_user', ''),
+                                              "toUser": scenario['to_user']})
+    navigator.metrics.add_tool_call("reassignItem", result, cached=client.last_call_cached)
     
     return success
 
-async def run_comparison(dataset_file: str, num_tests: int = 5, seed: int = None):
+# Dispatch tables keyed by (test_type, entity_type) - one dict probe
+# replaces the branch chains in the scenario executors.
+_FSM_SCENARIO_EXECUTORS = {
+    ('single_transition', 'task'): _fsm_update_task_state,
+    ('single_transition', 'bug'): _fsm_update_bug_state,
+    ('completion', 'task'): _fsm_update_task_state,
+    ('completion', 'bug'): _fsm_update_bug_state,
+    ('direct_access', 'task'): _fsm_direct_access,
+    ('direct_access', 'bug'): _fsm_direct_access,
+    ('reassignment', 'task'): _fsm_reassign,
+    ('reassignment', 'bug'): _fsm_reassign,
+}
+_PETRI_SCENARIO_EXECUTORS = {
+    ('single_transition', 'task'): _petri_update_state,
+    ('single_transition', 'bug'): _petri_update_state,
+    ('completion', 'task'): _petri_update_state,
+    ('completion', 'bug'): _petri_update_state,
+    ('direct_access', 'task'): _petri_direct_access,
+    ('direct_access', 'bug'): _petri_direct_access,
+    ('reassignment', 'task'): _petri_reassign,
+    ('reassignment', 'bug'): _petri_reassign,
+}
+
+def _report_scenario(results_stream, scenario, fsm_result, petri_result):
+    """Print one scenario's outcome and stream its JSONL record"""
+    fsm_success, fsm_calls, fsm_time = fsm_result
+    petri_success, petri_calls, petri_time = petri_result
+
+    # One write per scenario instead of five print syscalls
+    lines = [f"Scenario: {scenario['name']}",
+             f"  FSM: {'✓' if fsm_success else '✗'} ({fsm_calls} calls, {fsm_time:.2f}s)",
+             f"  Petri Net: {'✓' if petri_success else '✗'} ({petri_calls} calls, {petri_time:.2f}s)"]
+    if petri_calls > 0 and fsm_calls > 0:
+        lines.append(f"  Efficiency gain: {fsm_calls / petri_calls:.1f}x")
+    elif petri_success and not fsm_success:
+        lines.append("  FSM failed, Petri succeeded (architectural advantage)")
+    sys.stdout.write("\n".join(lines) + "\n\n")
+
+    results_stream.write(_dumps({
+        "scenario": scenario['id'],
+        "name": scenario['name'],
+        "fsm": {"success": fsm_success, "calls": fsm_calls, "time": fsm_time},
+        "petri": {"success": petri_success, "calls": petri_calls,
+                  "time": petri_time},
+    }) + "\n")
+    results_stream.flush()
+
+async def run_comparison(dataset_file: str, num_tests: int = 5, seed: int = None,
+                         results_suffix: str = '', concurrency: int = 1):
     """Run both navigators and compare results using real MCP calls"""
     
     print("=" * 80)
@@ -856,11 +920,12 @@ async def run_comparison(dataset_file: str, num_tests: int = 5, seed: int = None
     # Load the dataset file directly (same as MCP servers do)
     global WORKFLOW_DATA
     dataset_path = Path(__file__).parent.joinpath(dataset_file)
-    if not dataset_path.exists():
+    # Let open() do the stat - no separate existence probe
+    try:
+        WORKFLOW_DATA = load_dataset(str(dataset_path))
+    except OSError:
         print(f"Error: Dataset file not found: {dataset_path}")
         return
-        
-    WORKFLOW_DATA = json.loads(dataset_path.read_text())
     dataset = WORKFLOW_DATA
     
     print(f"Loaded dataset from: {dataset_path}")
@@ -868,14 +933,12 @@ async def run_comparison(dataset_file: str, num_tests: int = 5, seed: int = None
           f"{len(dataset['entities']['tasks'])} tasks, "
           f"{len(dataset['entities']['bugs'])} bugs")
     
-    # Generate test scenarios based on actual dataset content
+    # Generate test scenarios based on actual dataset content - the
+    # enumeration streams through the reservoir sampler in one pass
     print("Enumerating all possible tests from dataset...")
-    all_tests = enumerate_all_tests(dataset)
-    print(f"Found {len(all_tests)} total possible tests")
-    
-    # Select subset for this run
     print(f"Selecting {num_tests} tests (seed: {seed if seed is not None else 'random'})...")
-    scenarios = select_tests(all_tests, num_tests, seed)
+    scenarios, total_tests = select_tests(enumerate_all_tests(dataset), num_tests, seed)
+    print(f"Found {total_tests} total possible tests")
     
     if not scenarios:
         print(f"Error: Dataset {dataset_file} doesn't have enough entities for testing")
@@ -892,57 +955,92 @@ async def run_comparison(dataset_file: str, num_tests: int = 5, seed: int = None
     petri_navigator = PetriNetNavigatorTest(str(dataset_path))
     
     try:
-        await fsm_navigator.initialize()
-        await petri_navigator.initialize()
+        # The two servers are independent subprocesses - start, drive and
+        # stop them concurrently instead of serializing the round trips
+        await asyncio.gather(fsm_navigator.initialize(),
+                             petri_navigator.initialize())
         print("✓ Both MCP servers started successfully\n")
         
         print("Running comparison tests...\n")
-        
-        for scenario in scenarios:
-            print(f"Scenario: {scenario['name']}")
-            
-            # Execute scenario with both navigators
-            fsm_success, fsm_calls, fsm_time = await execute_scenario_fsm(fsm_navigator, scenario)
-            petri_success, petri_calls, petri_time = await execute_scenario_petri(petri_navigator, scenario)
-            
-            print(f"  FSM: {'✓' if fsm_success else '✗'} ({fsm_calls} calls, {fsm_time:.2f}s)")
-            print(f"  Petri Net: {'✓' if petri_success else '✗'} ({petri_calls} calls, {petri_time:.2f}s)")
-            
-            if petri_calls > 0 and fsm_calls > 0:
-                efficiency = fsm_calls / petri_calls
-                print(f"  Efficiency gain: {efficiency:.1f}x")
-            elif petri_success and not fsm_success:
-                print(f"  FSM failed, Petri succeeded (architectural advantage)")
-            print()
+
+        # Stream one record per scenario - partial results survive an
+        # interrupted run and memory stops growing with scenario count
+        results_stream = open(f'test-results{results_suffix}.jsonl', 'w')
+
+        if concurrency > 1:
+            # Bounded cross-scenario concurrency: each worker pair has
+            # its own subprocesses (and pristine dataset state), handed
+            # out through a queue
+            worker_pairs = [(fsm_navigator, petri_navigator)]
+            for worker in range(1, concurrency):
+                worker_pairs.append(
+                    (FSMNavigatorTest(str(dataset_path), worker=worker),
+                     PetriNetNavigatorTest(str(dataset_path), worker=worker)))
+            await asyncio.gather(*(nav.initialize()
+                                   for pair in worker_pairs[1:] for nav in pair))
+
+            pair_queue = asyncio.Queue()
+            for pair in worker_pairs:
+                pair_queue.put_nowait(pair)
+
+            async def run_one(scenario):
+                fsm_nav, petri_nav = await pair_queue.get()
+                try:
+                    return await asyncio.gather(
+                        execute_scenario_fsm(fsm_nav, scenario),
+                        execute_scenario_petri(petri_nav, scenario))
+                finally:
+                    pair_queue.put_nowait((fsm_nav, petri_nav))
+
+            outcomes = await asyncio.gather(*(run_one(s) for s in scenarios))
+            for scenario, (fsm_result, petri_result) in zip(scenarios, outcomes):
+                _report_scenario(results_stream, scenario, fsm_result, petri_result)
+
+            # Fold the extra workers' counters into the primary metrics
+            for fsm_nav, petri_nav in worker_pairs[1:]:
+                fsm_navigator.metrics.merge(fsm_nav.metrics)
+                petri_navigator.metrics.merge(petri_nav.metrics)
+        else:
+            for scenario in scenarios:
+                fsm_result, petri_result = await asyncio.gather(
+                    execute_scenario_fsm(fsm_navigator, scenario),
+                    execute_scenario_petri(petri_navigator, scenario))
+                _report_scenario(results_stream, scenario, fsm_result, petri_result)
+
+        results_stream.close()
         
         # Generate results
-        print("\n" + "=" * 80)
-        print("RESULTS SUMMARY")
-        print("=" * 80)
-        
-        print("\n## Overall Performance")
-        print(f"Total Tool Calls:")
-        print(f"  FSM Navigator: {fsm_navigator.metrics.tool_calls}")
-        print(f"  Petri Net Navigator: {petri_navigator.metrics.tool_calls}")
-        if petri_navigator.metrics.tool_calls > 0:
-            efficiency = fsm_navigator.metrics.tool_calls / petri_navigator.metrics.tool_calls
-            print(f"  Efficiency Gain: {efficiency:.1f}x")
-        
-        print(f"\nGoals Completed:")
-        print(f"  FSM Navigator: {len(fsm_navigator.metrics.goals_completed)}/{len(scenarios)}")
-        print(f"  Petri Net Navigator: {len(petri_navigator.metrics.goals_completed)}/{len(scenarios)}")
-        
-        print(f"\nAverage Calls per Goal:")
-        print(f"  FSM Navigator: {fsm_navigator.metrics.get_average_calls_per_goal():.1f}")
-        print(f"  Petri Net Navigator: {petri_navigator.metrics.get_average_calls_per_goal():.1f}")
-        
-        print(f"\nSemantic Hints Followed:")
-        print(f"  FSM Navigator: {fsm_navigator.metrics.semantic_hints_followed}")
-        print(f"  Petri Net Navigator: {petri_navigator.metrics.semantic_hints_followed}")
-        
-        print(f"\nErrors Encountered:")
-        print(f"  FSM Navigator: {fsm_navigator.metrics.errors_encountered}")
-        print(f"  Petri Net Navigator: {petri_navigator.metrics.errors_encountered}")
+        fsm_metrics = fsm_navigator.metrics
+        petri_metrics = petri_navigator.metrics
+        fsm_avg = fsm_metrics.get_average_calls_per_goal()
+        petri_avg = petri_metrics.get_average_calls_per_goal()
+
+        # Whole report assembled once and flushed in a single write
+        summary = ["\n" + "=" * 80,
+                   "RESULTS SUMMARY",
+                   "=" * 80,
+                   "\n## Overall Performance",
+                   "Total Tool Calls:",
+                   f"  FSM Navigator: {fsm_metrics.tool_calls}",
+                   f"  Petri Net Navigator: {petri_metrics.tool_calls}"]
+        if petri_metrics.tool_calls > 0:
+            efficiency = fsm_metrics.tool_calls / petri_metrics.tool_calls
+            summary.append(f"  Efficiency Gain: {efficiency:.1f}x")
+        summary += [
+            "\nGoals Completed:",
+            f"  FSM Navigator: {len(fsm_metrics.goals_completed)}/{len(scenarios)}",
+            f"  Petri Net Navigator: {len(petri_metrics.goals_completed)}/{len(scenarios)}",
+            "\nAverage Calls per Goal:",
+            f"  FSM Navigator: {fsm_avg:.1f}",
+            f"  Petri Net Navigator: {petri_avg:.1f}",
+            "\nSemantic Hints Followed:",
+            f"  FSM Navigator: {fsm_metrics.semantic_hints_followed}",
+            f"  Petri Net Navigator: {petri_metrics.semantic_hints_followed}",
+            "\nErrors Encountered:",
+            f"  FSM Navigator: {fsm_metrics.errors_encountered}",
+            f"  Petri Net Navigator: {petri_metrics.errors_encountered}",
+        ]
+        sys.stdout.write("\n".join(summary) + "\n")
         
         # Save results
         results = {
@@ -951,7 +1049,7 @@ async def run_comparison(dataset_file: str, num_tests: int = 5, seed: int = None
             "fsm_metrics": {
                 "tool_calls": fsm_navigator.metrics.tool_calls,
                 "goals_completed": fsm_navigator.metrics.goals_completed,
-                "average_calls_per_goal": fsm_navigator.metrics.get_average_calls_per_goal(),
+                "average_calls_per_goal": fsm_avg,
                 "semantic_hints_followed": fsm_navigator.metrics.semantic_hints_followed,
                 "errors": fsm_navigator.metrics.errors_encountered,
                 "time_elapsed": fsm_navigator.metrics.time_elapsed
@@ -959,7 +1057,7 @@ async def run_comparison(dataset_file: str, num_tests: int = 5, seed: int = None
             "petri_metrics": {
                 "tool_calls": petri_navigator.metrics.tool_calls,
                 "goals_completed": petri_navigator.metrics.goals_completed,
-                "average_calls_per_goal": petri_navigator.metrics.get_average_calls_per_goal(),
+                "average_calls_per_goal": petri_avg,
                 "semantic_hints_followed": petri_navigator.metrics.semantic_hints_followed,
                 "errors": petri_navigator.metrics.errors_encountered,
                 "time_elapsed": petri_navigator.metrics.time_elapsed
@@ -967,15 +1065,14 @@ async def run_comparison(dataset_file: str, num_tests: int = 5, seed: int = None
             "efficiency_gain": (fsm_navigator.metrics.tool_calls / petri_navigator.metrics.tool_calls 
                               if petri_navigator.metrics.tool_calls > 0 else 0),
             "paths": {
-                "fsm": [[call for call in path] for path in fsm_navigator.metrics.paths_taken],
-                "petri": [[call for call in path] for path in petri_navigator.metrics.paths_taken]
+                "fsm": fsm_navigator.metrics.paths_as_lists(),
+                "petri": petri_navigator.metrics.paths_as_lists()
             }
         }
         
-        with open('test-results.json', 'w') as f:
-            json.dump(results, f, indent=2)
-        
-        print("\n✅ Results saved to test-results.json")
+        _dump_summary(results, f'test-results{results_suffix}.json')
+
+        print(f"\n✅ Results saved to test-results{results_suffix}.json")
         
         # Key findings
         print("\n## Key Findings")
@@ -988,11 +1085,17 @@ async def run_comparison(dataset_file: str, num_tests: int = 5, seed: int = None
     finally:
         # Cleanup
         print("\nShutting down MCP servers...")
-        await fsm_navigator.cleanup()
-        await petri_navigator.cleanup()
+        await asyncio.gather(fsm_navigator.cleanup(), petri_navigator.cleanup())
         print("✓ Cleanup complete")
 
-# Gauntlet functionality removed - users can run datasets individually
+async def run_all(dataset_files, num_tests: int = 5, seed: int = None,
+                  concurrency: int = 1):
+    """Run every dataset comparison concurrently - each spawns disjoint
+    subprocesses and writes its own suffixed result files"""
+    await asyncio.gather(*(run_comparison(f, num_tests, seed,
+                                          results_suffix=f"-{Path(f).stem}",
+                                          concurrency=concurrency)
+                           for f in dataset_files))
 
 if __name__ == "__main__":
     import sys
@@ -1000,11 +1103,22 @@ if __name__ == "__main__":
     
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Test Harness for Comparing FSM vs Petri Net Navigators')
-    parser.add_argument('dataset_file', help='Path to dataset JSON file')
+    parser.add_argument('dataset_file', nargs='+',
+                       help='Path to dataset JSON file(s)')
     parser.add_argument('-n', '--num-tests', type=int, default=5, 
                        help='Number of tests to run (default: 5)')
     parser.add_argument('-s', '--seed', type=int, default=None,
                        help='Random seed for reproducible test selection (default: random)')
+    parser.add_argument('-c', '--concurrency', type=int, default=1,
+                       help='Worker pairs running scenarios concurrently '
+                            '(each pair gets its own servers; default: 1)')
+    parser.add_argument('--parallel', action='store_true',
+                       help='Run multiple datasets concurrently with '
+                            'per-dataset result files')
+    parser.add_argument('--transport', choices=['stdio', 'in-process'],
+                       default=TRANSPORT,
+                       help='stdio spawns MCP subprocesses; in-process imports '
+                            'the navigator modules directly (no RPC overhead)')
     parser.add_argument('--list-all', action='store_true',
                        help='List all possible tests in the dataset and exit')
     
@@ -1013,23 +1127,35 @@ if __name__ == "__main__":
     if args.list_all:
         # Load dataset and list all possible tests
         from pathlib import Path
-        dataset_path = Path(args.dataset_file)
+        dataset_path = Path(args.dataset_file[0])
         if not dataset_path.exists():
             print(f"Error: Dataset file not found: {dataset_path}")
             sys.exit(1)
         
-        WORKFLOW_DATA = json.loads(dataset_path.read_text())
-        all_tests = enumerate_all_tests(WORKFLOW_DATA)
+        WORKFLOW_DATA = load_dataset(str(dataset_path))
+        all_tests = list(enumerate_all_tests(WORKFLOW_DATA))
         
-        print(f"Dataset: {args.dataset_file}")
+        print(f"Dataset: {dataset_path}")
         print(f"Total possible tests: {len(all_tests)}")
         print("\nAll possible tests:")
         for i, test in enumerate(all_tests, 1):
             print(f"{i:3d}. {test['name']} ({test['test_type']}, {test['complexity']})")
         
         print(f"\nTo run a subset:")
-        print(f"  python test-harness.py {args.dataset_file} -n 10")
-        print(f"  python test-harness.py {args.dataset_file} -n 10 -s 42  # reproducible")
+        print(f"  python test-harness.py {dataset_path} -n 10")
+        print(f"  python test-harness.py {dataset_path} -n 10 -s 42  # reproducible")
         sys.exit(0)
     
-    asyncio.run(run_comparison(args.dataset_file, args.num_tests, args.seed))
\ No newline at end of file
+    TRANSPORT = args.transport
+    multi_dataset = len(args.dataset_file) > 1
+    if args.parallel and multi_dataset:
+        asyncio.run(run_all(args.dataset_file, args.num_tests, args.seed,
+                            concurrency=args.concurrency))
+    else:
+        for dataset_file in args.dataset_file:
+            # Suffix whenever several datasets run, sequential included -
+            # otherwise each run clobbers the previous results
+            suffix = f"-{Path(dataset_file).stem}" if multi_dataset else ''
+            asyncio.run(run_comparison(dataset_file, args.num_tests, args.seed,
+                                       results_suffix=suffix,
+                                       concurrency=args.concurrency))
\ No newline at end of file